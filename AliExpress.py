@@ -19,7 +19,7 @@ Description :
 		- Price information (current and old prices with integer and decimal parts)
 		- Discount percentage extraction
 		- Product images download
-		- Complete page snapshot capture (HTML + localized assets)
+		- Optional page snapshot capture (HTML + localized assets)
 		- Product description file generation in marketing template format
 		- Organized output in product-specific directories
 
@@ -34,8 +34,8 @@ Usage:
 Outputs:
     - Product data dictionary with all extracted information
     - Downloaded images in ./Outputs/{Product Name}/ directory
-    - Complete page snapshot in ./Outputs/{Product Name}/page.html
-    - Localized assets in ./Outputs/{Product Name}/assets/ directory
+    - Complete page snapshot in ./Outputs/{Product Name}/page.html (only when save_snapshot=True)
+    - Localized assets in ./Outputs/{Product Name}/assets/ directory (only when save_snapshot=True)
     - Product description .txt file with marketing template in ./Outputs/{Product Name}/ directory
     - Log files in ./Logs/ directory
 
@@ -63,6 +63,7 @@ Assumptions & Notes:
 
 import atexit  # Register functions to execute at program termination
 import datetime  # Handle date and time operations
+import hashlib  # Hash downloaded image bytes to skip duplicates
 import os  # Interact with operating system functionalities
 import platform  # Access underlying platform information
 import re  # Perform regular expression operations
@@ -74,7 +75,6 @@ from bs4 import BeautifulSoup, Tag  # Parse and navigate HTML documents
 from colorama import Style  # Colorize terminal text output
 from Logger import Logger  # Custom logging functionality for output redirection
 from pathlib import Path  # Handle filesystem paths in object-oriented way
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError  # Browser automation framework with timeout handling
 from product_utils import normalize_product_name  # Centralized product dir name normalization
 from typing import Optional, Dict, Any, List, Tuple, cast  # Type hinting support for better code clarity
 from urllib.parse import urljoin, urlparse  # Parse and manipulate URLs for asset collection
@@ -135,6 +135,19 @@ HTML_SELECTORS = {
     "shipping_options": {"class": "vat-installment--item--Fgco36c"},  # CSS selector for shipping/tax notice
 }  # Dictionary containing all HTML selectors used for scraping product information
 
+# Regex Constants:
+CURRENCY_SYMBOLS_PATTERN = re.compile(r"[R$€£¥]")  # Match common currency symbols to strip from price strings
+BRAZILIAN_CURRENCY_PATTERN = re.compile(r"([0-9.]+)[,.]([0-9]{2})")  # Match Brazilian currency with dot thousands and comma decimals
+PRICE_PATTERN = re.compile(r"(\d+(?:[\.,]\d{3})*)[,\.](\d{2})")  # Match price with optional thousands separators and two decimals
+DISCOUNT_PATTERN = re.compile(r"(\d+%)")  # Match discount percentage values
+WHITESPACE_PATTERN = re.compile(r"\s+")  # Match whitespace runs to collapse into single spaces
+IMAGE_SIZE_FRAGMENT_PATTERN = re.compile(r"_\d{2,4}x\d{2,4}(q\d+)?(\.jpg|\.png|\.avif)?")  # Match AliExpress image size suffixes
+VIDEO_EXTENSION_PATTERNS = tuple(re.compile(re.escape(ext)) for ext in (".mp4", ".webm", ".m3u8"))  # Match video file extensions inside page strings
+URL_PATTERN = re.compile(r"https?://[\w\-./%?=,&]+\"?")  # Match full URLs embedded in page strings
+MARKDOWN_BOLD_PATTERN = re.compile(r"\*\*(.*?)\*\*")  # Match markdown bold formatting
+EXCESS_NEWLINES_PATTERN = re.compile(r"\n{3,}")  # Match three or more consecutive newlines
+SENTENCE_DELIMITER_PATTERN = re.compile(r"([.!?]\s*)")  # Match sentence delimiters while keeping them in split results
+
 # Output Directory Constants:
 OUTPUT_DIRECTORY = "./Outputs/"  # Base directory for storing scraped data and media files
 
@@ -190,7 +203,7 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
     """
 
 
-    def __init__(self, url: str, local_html_path: Optional[str] = None, prefix: str = "", output_directory: str = OUTPUT_DIRECTORY) -> None:
+    def __init__(self, url: str, local_html_path: Optional[str] = None, prefix: str = "", output_directory: str = OUTPUT_DIRECTORY, save_snapshot: bool = False) -> None:
         """
         Initializes the AliExpress scraper with a product URL and optional local HTML file path.
 
@@ -198,6 +211,7 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
         :param local_html_path: Optional path to a local HTML file for offline scraping
         :param prefix: Optional platform prefix for output directory naming (e.g., "AliExpress")
         :param output_directory: Output directory path for storing scraped data (defaults to OUTPUT_DIRECTORY constant)
+        :param save_snapshot: Whether to download page assets and save a localized HTML snapshot in online mode (defaults to False)
         :return: None
         """
 
@@ -208,9 +222,11 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
         self.product_data: Dict[str, Any] = {}  # Initialize empty dictionary to store extracted product data
         self.prefix: str = prefix  # Store the platform prefix for directory naming
         self.output_directory: str = output_directory  # Store the output directory path for this scraping session
+        self.save_snapshot_enabled: bool = save_snapshot  # Store whether the page assets and HTML snapshot should be saved
         self.playwright: Optional[Any] = None  # Placeholder for Playwright instance
         self.browser: Optional[Any] = None  # Placeholder for browser instance
         self.page: Optional[Any] = None  # Placeholder for page object
+        self.seen_image_hashes: set = set()  # Hashes of downloaded image bytes, used to skip duplicate images
 
         verbose_output(  # Output initialization message to user
             f"{BackgroundColors.GREEN}AliExpress scraper initialized with URL: {BackgroundColors.CYAN}{url}{Style.RESET_ALL}"
@@ -234,6 +250,8 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
         )  # End of verbose output call
 
         try:  # Attempt to launch browser with error handling
+            from playwright.sync_api import sync_playwright  # Import Playwright lazily so offline (local HTML) runs skip its import cost
+
             self.playwright = sync_playwright().start()  # Start Playwright synchronous context manager
             playwright_obj = cast(Any, self.playwright)  # Cast Playwright instance to Any for static type verifiers
             
@@ -319,6 +337,8 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
             print(f"{BackgroundColors.RED}Page instance not initialized.{Style.RESET_ALL}")  # Alert user that page is not ready
             return False  # Return failure status if page is not initialized
 
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError  # Import lazily, Playwright is already loaded by launch_browser
+
         try:  # Attempt page loading with error handling
             self.page.goto(self.product_url, timeout=PAGE_LOAD_TIMEOUT, wait_until="domcontentloaded")  # Navigate to product URL and wait for DOM to load
             
@@ -586,10 +606,10 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
             return None  # Return None when input is empty
         
         normalized = price_text.strip()  # Remove leading and trailing whitespace
-        normalized = re.sub(r"[R$€£¥]", "", normalized)  # Remove common currency symbols from price string
+        normalized = CURRENCY_SYMBOLS_PATTERN.sub("", normalized)  # Remove common currency symbols from price string
         normalized = normalized.replace("\u00A0", " ").strip()  # Replace NBSP with space and strip again
         
-        match = re.search(r"([0-9.]+)[,.]([0-9]{2})", normalized)  # Search for Brazilian currency pattern with dots and comma
+        match = BRAZILIAN_CURRENCY_PATTERN.search(normalized)  # Search for Brazilian currency pattern with dots and comma
         if not match:  # Verify if no price pattern was found
             return None  # Return None when pattern doesn't match
         
@@ -620,7 +640,7 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
             product_name = f"International - {product_name}"  # Add International prefix
             # Normalize whitespace after prefix insertion to avoid accidental double spaces
             product_name = product_name.replace("\u00A0", " ")  # Replace NBSP with normal space
-            product_name = re.sub(r"\s+", " ", product_name).strip()  # Collapse multiple whitespace to single spaces
+            product_name = WHITESPACE_PATTERN.sub(" ", product_name).strip()  # Collapse multiple whitespace to single spaces
             verbose_output(  # Log name modification
                 f"{BackgroundColors.GREEN}Updated product name: {BackgroundColors.CYAN}{product_name}{Style.RESET_ALL}"
             )  # End of verbose output call
@@ -640,7 +660,7 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
             price_element = soup.find(tag, attrs if attrs else None)  # type: ignore[arg-type]  # Search for element matching current selector
             if price_element:  # Verify if matching element was found
                 price_text = price_element.get_text(strip=True)  # Extract and clean text content from element
-                match = re.search(r"(\d+(?:[\.,]\d{3})*)[,\.](\d{2})", price_text)  # Search for Brazilian price format with thousands separators and decimal
+                match = PRICE_PATTERN.search(price_text)  # Search for Brazilian price format with thousands separators and decimal
                 if match:  # Verify if price pattern was found in text
                     integer_with_sep = match.group(1)  # Extract integer part with potential thousands separators
                     integer_part = integer_with_sep.replace(".", "").replace(",", "")  # Remove thousands separators (dots)
@@ -668,7 +688,7 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
             price_element = soup.find(tag, attrs if attrs else None)  # type: ignore[arg-type]  # Search for element matching current selector
             if price_element:  # Verify if matching element was found
                 price_text = price_element.get_text(strip=True)  # Extract and clean text content from element
-                match = re.search(r"(\d+(?:[\.,]\d{3})*)[,\.](\d{2})", price_text)  # Search for Brazilian price format with thousands separators and decimal
+                match = PRICE_PATTERN.search(price_text)  # Search for Brazilian price format with thousands separators and decimal
                 if match:  # Verify if price pattern was found in text
                     integer_with_sep = match.group(1)  # Extract integer part with potential thousands separators
                     integer_part = integer_with_sep.replace(".", "").replace(",", "")  # Remove thousands separators (dots)
@@ -696,7 +716,7 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
             discount_element = soup.find(tag, attrs if attrs else None)  # type: ignore[arg-type]  # Search for element matching current selector
             if discount_element:  # Verify if matching element was found
                 discount_text = discount_element.get_text(strip=True)  # Extract and clean text content from element
-                match = re.search(r"(\d+%)", discount_text)  # Search for discount percentage pattern
+                match = DISCOUNT_PATTERN.search(discount_text)  # Search for discount percentage pattern
                 if match:  # Verify if discount pattern was found in text
                     verbose_output(  # Log successfully extracted discount percentage
                         f"{BackgroundColors.GREEN}Discount: {match.group(1)}{Style.RESET_ALL}"
@@ -813,7 +833,7 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
                     if not src or not isinstance(src, str):  # Skip if src missing or invalid
                         continue  # Continue to next image
                     # Prefer higher resolution images by replacing common size fragments  # try to upgrade to larger image
-                    src_high = re.sub(r"_\d{2,4}x\d{2,4}(q\d+)?(\.jpg|\.png|\.avif)?", "_960x960q75.jpg", src)  # Attempt to create high-res URL
+                    src_high = IMAGE_SIZE_FRAGMENT_PATTERN.sub("_960x960q75.jpg", src)  # Attempt to create high-res URL
                     final_url = src_high if src_high else src  # Choose final URL
                     if final_url.startswith("//"):  # Fix protocol-relative URLs
                         final_url = "https:" + final_url  # Prepend https scheme
@@ -901,11 +921,11 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
                             )  # End of verbose output call
 
             # Also search for direct links to video files in the page (heuristic)  # catch videos embedded via JS
-            for ext in ('.mp4', '.webm', '.m3u8'):  # Verify common extensions
-                for tag in soup.find_all(string=re.compile(re.escape(ext))):  # Find strings containing extension
+            for ext_pattern in VIDEO_EXTENSION_PATTERNS:  # Verify common extensions
+                for tag in soup.find_all(string=ext_pattern):  # Find strings containing extension
                     try:  # Attempt to extract URL-like text
                         text = str(tag)  # Convert to string
-                        m = re.search(r"https?://[\w\-./%?=,&]+\"?", text)  # Attempt to find full URL pattern
+                        m = URL_PATTERN.search(text)  # Attempt to find full URL pattern
                         if m:  # If match found
                             url = m.group(0).strip('"')  # Clean up
                             if url not in seen_urls:  # Avoid duplicates
@@ -1070,8 +1090,7 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
                         filename = f"{idx:02d}_{original_basename}{ext}"  # Generate filename with two-digit index prefix and original basename
                         filepath = os.path.join(assets_dir, filename)  # Construct full file path for saving
                         
-                        with open(filepath, "wb") as f:  # Open file in binary write mode
-                            f.write(response.body())  # Write response body to file
+                        write_binary_file(filepath, response.body())  # Write response body to file in a single unbuffered write
                         
                         asset_map[src] = f"assets/{filename}"  # Map original URL to local relative path
                         verbose_output(  # Log successful download
@@ -1199,9 +1218,9 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
         if not text:  # If text is empty
             return text  # Return as is
         
-        text = re.sub(r"\*\*(.*?)\*\*", r"\1", text)  # Remove markdown bold formatting
+        text = MARKDOWN_BOLD_PATTERN.sub(r"\1", text)  # Remove markdown bold formatting
         
-        text = re.sub(r"\n{3,}", "\n\n", text)  # Replace 3 or more newlines with 2 newlines
+        text = EXCESS_NEWLINES_PATTERN.sub("\n\n", text)  # Replace 3 or more newlines with 2 newlines
         
         lines = text.split("\n")  # Split into lines
         cleaned_lines = []  # List to store cleaned lines
@@ -1211,7 +1230,7 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
                 cleaned_lines.append(cleaned_line)  # Add cleaned line
         
         text = "\n".join(cleaned_lines)  # Join cleaned lines
-        text = re.sub(r"\n{3,}", "\n\n", text)  # Ensure no more than 2 consecutive newlines
+        text = EXCESS_NEWLINES_PATTERN.sub("\n\n", text)  # Ensure no more than 2 consecutive newlines
         
         return text.strip()  # Return cleaned text
 
@@ -1227,7 +1246,7 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
         if not text:  # Validate that text is not empty before processing
             return text  # Return original text if it's empty or None
 
-        sentences = re.split(r"([.!?]\s*)", text)  # Keep the delimiters
+        sentences = SENTENCE_DELIMITER_PATTERN.split(text)  # Keep the delimiters
 
         result = []  # Initialize list to hold processed sentences
         for i, sentence in enumerate(sentences):  # Iterate through each sentence with index
@@ -1241,6 +1260,22 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
         return "".join(result)  # Join all sentences and delimiters back into a single string
 
 
+    def is_duplicate_image(self, image_bytes: bytes) -> bool:
+        """
+        Verifies if the given image bytes were already saved during this scrape, recording them otherwise.
+        AliExpress often serves the same picture under several URLs (size suffixes, tracking params).
+
+        :param image_bytes: Raw bytes of the downloaded image
+        :return: True if an identical image was already saved, False otherwise
+        """
+
+        image_hash = hashlib.md5(image_bytes).hexdigest()  # Compute MD5 hash of the image bytes
+        if image_hash in self.seen_image_hashes:  # Verify if the same bytes were already saved
+            return True  # Signal duplicate image
+        self.seen_image_hashes.add(image_hash)  # Record the hash of the new image
+        return False  # Signal first occurrence
+
+
     def download_single_image(self, img_url: str, output_dir: str, image_count: int) -> Optional[str]:
         """
         Downloads or copies a single image to the specified output directory.
@@ -1249,7 +1284,7 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
         :param img_url: URL of the image to download (HTTP URL or local path)
         :param output_dir: Directory to save the image
         :param image_count: Counter for generating unique filenames
-        :return: Path to downloaded image file or None if download failed
+        :return: Path to downloaded image file or None if download failed or duplicated an already saved image
         """
         
         try:  # Attempt to download or copy the image with error handling
@@ -1295,9 +1330,15 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
                         original_basename = os.path.splitext(os.path.basename(parsed_url.path))[0]  # Extract original filename without extension from URL path
                         filename = f"{image_count:02d}_{original_basename}{ext}"  # Generate filename with two-digit index prefix and original basename
                         filepath = os.path.join(output_dir, filename)  # Create full path
+                        image_bytes = response.body()  # Read the downloaded image bytes once
+                        
+                        if self.is_duplicate_image(image_bytes):  # Skip images byte-identical to one already saved
+                            verbose_output(  # Log skipped duplicate
+                                f"{BackgroundColors.YELLOW}Skipped duplicate image: {BackgroundColors.CYAN}{filename}{Style.RESET_ALL}"
+                            )  # End of verbose output call
+                            return None  # Return None so the duplicate is not listed
                         
-                        with open(filepath, "wb") as f:  # Open file in binary write mode
-                            f.write(response.body())  # Write response body to file
+                        write_binary_file(filepath, image_bytes)  # Write image bytes to file in a single unbuffered write
                         
                         verbose_output(  # Log successful download
                             f"{BackgroundColors.GREEN}Downloaded image: {BackgroundColors.CYAN}{filename}{Style.RESET_ALL}"
@@ -1313,9 +1354,15 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
                         original_basename = os.path.splitext(os.path.basename(parsed_url.path))[0]  # Extract original filename without extension from URL path
                         filename = f"{image_count:02d}_{original_basename}{ext}"  # Generate filename with two-digit index prefix and original basename
                         filepath = os.path.join(output_dir, filename)  # Create full path
+                        image_bytes = response.content  # Read the downloaded image bytes once
                         
-                        with open(filepath, "wb") as f:  # Open file in binary write mode
-                            f.write(response.content)  # Write content to file
+                        if self.is_duplicate_image(image_bytes):  # Skip images byte-identical to one already saved
+                            verbose_output(  # Log skipped duplicate
+                                f"{BackgroundColors.YELLOW}Skipped duplicate image: {BackgroundColors.CYAN}{filename}{Style.RESET_ALL}"
+                            )  # End of verbose output call
+                            return None  # Return None so the duplicate is not listed
+                        
+                        write_binary_file(filepath, image_bytes)  # Write image bytes to file in a single unbuffered write
                         
                         verbose_output(  # Log successful download
                             f"{BackgroundColors.GREEN}Downloaded image: {BackgroundColors.CYAN}{filename}{Style.RESET_ALL}"
@@ -1450,8 +1497,7 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
                         filename = f"video_{video_count:03d}{ext}"  # Generate filename
                         video_path = os.path.join(output_dir, filename)  # Create full path
                         
-                        with open(video_path, "wb") as f:  # Open file in binary write mode
-                            f.write(response.body())  # Write response body to file
+                        write_binary_file(video_path, response.body())  # Write response body to file in a single unbuffered write
                         
                         verbose_output(  # Log successful download
                             f"{BackgroundColors.GREEN}Downloaded video: {BackgroundColors.CYAN}{filename}{Style.RESET_ALL}"
@@ -1466,8 +1512,7 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
                         filename = f"video_{video_count:03d}{ext}"  # Generate filename
                         video_path = os.path.join(output_dir, filename)  # Create full path
                         
-                        with open(video_path, "wb") as f:  # Open file in binary write mode
-                            f.write(response.content)  # Write content to file
+                        write_binary_file(video_path, response.content)  # Write content to file in a single unbuffered write
                         
                         verbose_output(  # Log successful download
                             f"{BackgroundColors.GREEN}Downloaded video: {BackgroundColors.CYAN}{filename}{Style.RESET_ALL}"
@@ -1583,7 +1628,7 @@ class AliExpress:  # AliExpress scraper class preserving structure and methods
             video_files = self.download_product_videos(soup, output_dir)  # Download all product videos
             downloaded_files.extend(video_files)  # Add video files to downloaded list
             
-            if not self.local_html_path:  # Only collect assets and save snapshot when not using a provided local HTML
+            if self.save_snapshot_enabled and not self.local_html_path:  # Only collect assets and save snapshot when requested and not using a provided local HTML
                 asset_map = self.collect_assets(html_content, output_dir)  # Download and collect all page assets
                 
                 snapshot_path = self.save_snapshot(html_content, output_dir, asset_map)  # Save HTML snapshot with localized assets
@@ -1725,6 +1770,26 @@ def verify_filepath_exists(filepath):
     return os.path.exists(filepath)  # Return True if the file or folder exists, False otherwise
 
 
+def write_binary_file(filepath, data):
+    """
+    Writes a binary payload to disk with raw os.write calls, bypassing Python's buffered I/O layer.
+
+    :param filepath: Path to the destination file
+    :param data: Bytes payload to be written
+    :return: None
+    """
+
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)  # Truncating write flags (O_BINARY only exists on Windows)
+    fd = os.open(filepath, flags, 0o644)  # Open the raw file descriptor
+    try:  # Ensure the descriptor is always closed
+        view = memoryview(data)  # Zero-copy view over the payload
+        while view:  # Loop only if the kernel accepted a partial write
+            written = os.write(fd, view)  # Write the remaining bytes in one syscall
+            view = view[written:]  # Advance past the bytes already written
+    finally:  # Release the descriptor even on failure
+        os.close(fd)  # Close the raw file descriptor
+
+
 def verify_dot_env_file():
     """
     Verifies if the .env file exists in the current directory.
@@ -1877,10 +1942,6 @@ def main():
     print(  # Display program completion message
         f"{BackgroundColors.BOLD}{BackgroundColors.GREEN}Program finished.{Style.RESET_ALL}"
     )  # End of print statement
-    
-    (  # Register sound playback function if enabled using ternary expression
-        atexit.register(play_sound) if RUN_FUNCTIONS["Play Sound"] else None  # Register play_sound to run at exit if enabled
-    )  # End of ternary expression
 
 
 if __name__ == "__main__":
@@ -1890,4 +1951,7 @@ if __name__ == "__main__":
     :return: None
     """
 
+    if RUN_FUNCTIONS.get("Play Sound"):  # Register before main() runs so the sound also plays on interrupted or failed runs
+        atexit.register(play_sound)  # Register play_sound to run at exit
+
     main()  # Call the main function
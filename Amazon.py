@@ -31,6 +31,8 @@ Usage:
     3. Call the scrape method to extract product information:
         product_data = scraper.scrape()
     4. Media files are saved in ./Outputs/{Product Name}/ directory.
+    5. To scrape several products with a single browser, call:
+        results = Amazon.scrape_many(["https://amazon.com.br/product-1", "https://amazon.com.br/product-2"])
 
 Outputs:
     - Product data dictionary with all extracted information
@@ -63,7 +65,10 @@ Assumptions & Notes:
 """
 
 import atexit  # Register functions to execute at program termination
+import concurrent.futures  # Run post-render product processing concurrently
 import datetime  # Handle date and time operations
+import importlib.util  # Detect optional parser backends without importing them
+import mmap  # Map local HTML files into memory without an intermediate bytes copy
 import os  # Interact with operating system functionalities
 import platform  # Access underlying platform information
 import random  # Generate jitter and pacing delays for resilient HTTP retries
@@ -73,6 +78,7 @@ import shutil  # For copying files (local HTML mode)
 import subprocess  # For running external commands (ffmpeg)
 import sys  # Access system-specific parameters and functions
 import time  # Provide time-related functions for delays
+from requests.adapters import HTTPAdapter  # Configure connection pooling for HTTP sessions
 from bs4 import BeautifulSoup, Tag  # Parse and navigate HTML documents
 from colorama import Style  # Colorize terminal text output
 from Logger import Logger  # Custom logging functionality for output redirection
@@ -80,7 +86,7 @@ from pathlib import Path  # Handle filesystem paths in object-oriented way
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError  # Browser automation framework with timeout handling
 from product_utils import normalize_product_name  # Centralized product dir name normalization
 from typing import Optional, Dict, Any, List, Tuple, cast  # Type hinting support for better code clarity
-from urllib.parse import urljoin, urlparse  # Parse and manipulate URLs for asset collection
+from urllib.parse import urljoin, urlparse, urlsplit  # Parse and manipulate URLs for asset collection
 
 
 # Macros:
@@ -97,37 +103,40 @@ class BackgroundColors:  # Colors for the terminal
 # Execution Constants:
 VERBOSE = False  # Set to True to output verbose messages
 
+# HTML Parser Constants:
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"  # Prefer the C-based lxml parser, falling back to the built-in parser when unavailable
+
 # Affiliate URL detection pattern (short AliExpress redirect links)  # keep generic pattern for now
 AFFILIATE_URL_PATTERN = r"https?://(?:www\.)?amzn\.to/[A-Za-z0-9]+/?"  # Affiliate URL detection pattern for amzn.to short links
 
 # HTML Selectors Dictionary:
 HTML_SELECTORS = {
-    "product_name": [  # List of CSS selectors for product name in priority order
+    "product_name": (  # Tuple of CSS selectors for product name in priority order
         ("span", {"id": "productTitle"}),  # Amazon product title span with specific id
         ("h1", {"id": "title"}),  # Alternative H1 heading for product title
         ("h1", {}),  # Generic H1 heading as last resort fallback
-    ],
-    "current_price": [  # List of CSS selectors for current price in priority order
+    ),
+    "current_price": (  # Tuple of CSS selectors for current price in priority order
         ("span", {"class": "a-price aok-align-center reinventPricePriceToPayMargin priceToPay"}),  # Amazon current price container
-        ("span", {"class": re.compile(r".*priceToPay.*", re.IGNORECASE)}),  # Generic price to pay pattern fallback
-        ("span", {"class": re.compile(r".*a-price.*", re.IGNORECASE)}),  # Generic price span as last resort fallback
-    ],
-    "old_price": [  # List of CSS selectors for old price in priority order
+        ("span", {"class": lambda value: bool(value) and "pricetopay" in value.lower()}),  # Generic price to pay pattern fallback
+        ("span", {"class": lambda value: bool(value) and "a-price" in value.lower()}),  # Generic price span as last resort fallback
+    ),
+    "old_price": (  # Tuple of CSS selectors for old price in priority order
         ("span", {"class": "a-price a-text-price"}),  # Amazon old price container with specific class
-        ("span", {"class": re.compile(r".*a-text-price.*", re.IGNORECASE)}),  # Generic original price pattern fallback
-        ("span", {"class": re.compile(r".*list.*price.*", re.IGNORECASE)}),  # Generic list price span as last resort fallback
-    ],
-    "discount": [  # List of CSS selectors for discount percentage in priority order
+        ("span", {"class": lambda value: bool(value) and "a-text-price" in value.lower()}),  # Generic original price pattern fallback
+        ("span", {"class": lambda value: bool(value) and "price" in value.lower().partition("list")[2]}),  # Generic list price span as last resort fallback
+    ),
+    "discount": (  # Tuple of CSS selectors for discount percentage in priority order
         ("span", {"class": "a-size-large a-color-price savingPriceOverride aok-align-center reinventPriceSavingsPercentageMargin savingsPercentage"}),  # Amazon discount container with specific class
-        ("span", {"class": re.compile(r".*savingsPercentage.*", re.IGNORECASE)}),  # Generic discount span fallback
-        ("span", {"class": re.compile(r".*discount.*", re.IGNORECASE)}),  # Sale badge container as last resort fallback
-    ],
+        ("span", {"class": lambda value: bool(value) and "savingspercentage" in value.lower()}),  # Generic discount span fallback
+        ("span", {"class": lambda value: bool(value) and "discount" in value.lower()}),  # Sale badge container as last resort fallback
+    ),
     "real_discount": {"class": "a-size-large a-color-price savingPriceOverride aok-align-center reinventPriceSavingsPercentageMargin savingsPercentage"},  # CSS selector for the real Amazon discount element
-    "description": [  # List of CSS selectors for product description in priority order
+    "description": (  # Tuple of CSS selectors for product description in priority order
         ("div", {"class": "a-section a-spacing-large bucket"}),  # Amazon description container with specific class
         ("div", {"id": "feature-bullets"}),  # Feature bullets section fallback
-        ("div", {"class": re.compile(r".*description.*", re.IGNORECASE)}),  # Generic description pattern fallback
-    ],
+        ("div", {"class": lambda value: bool(value) and "description" in value.lower()}),  # Generic description pattern fallback
+    ),
     "image_block": {"data-old-hires": True},  # CSS selector for tags exposing high-resolution product image URLs
     "gallery": {"id": "altImages"},  # CSS selector for product gallery container with images
     "detail_table": {"id": "productDetails_techSpec_section_1"},  # CSS selector for product details table
@@ -135,21 +144,61 @@ HTML_SELECTORS = {
     "foreign_seller_badge": "https://m.media-amazon.com/images/G/32/foreignseller/Foreign_Seller_Badge_v2._CB403622375_.png",  # Foreign seller badge image URL
 }  # Dictionary containing all HTML selectors used for scraping product information
 
+# Regex Constants:
+CURRENCY_SYMBOLS_PATTERN = re.compile(r"[R$€£¥]")  # Match common currency symbols to strip from price strings
+BRAZILIAN_CURRENCY_PATTERN = re.compile(r"([0-9.]+)[,.]([0-9]{2})")  # Match Brazilian currency with dot thousands and comma decimals
+DISCOUNT_NUMBER_PATTERN = re.compile(r"(\d+(?:[\.,]\d+)?)")  # Match the numeric component of a scraped discount text
+WHITESPACE_PATTERN = re.compile(r"\s+")  # Match whitespace runs to collapse into single spaces
+CURRENT_PRICE_CLASS_PATTERN = re.compile(r"priceToPay|reinventPricePriceToPayMargin|aok-align-center", re.IGNORECASE)  # Match class tokens used by current price markup
+OLD_PRICE_CLASS_PATTERN = re.compile(r"a-text-price|basisPrice|apex-basisprice-value", re.IGNORECASE)  # Match class tokens used by old/list price markup
+OLD_PRICE_TEXT_PATTERN = re.compile(r"De:|List Price|Preço", re.IGNORECASE)  # Match textual old price labels
+MARKDOWN_BOLD_PATTERN = re.compile(r"\*\*(.*?)\*\*")  # Match markdown bold formatting
+EXCESS_NEWLINES_PATTERN = re.compile(r"\n{3,}")  # Match three or more consecutive newlines
+SENTENCE_DELIMITER_PATTERN = re.compile(r"([.!?]\s*)")  # Match sentence delimiters while keeping them in split results
+
+# International Detection Constants:
+INTERNATIONAL_TEXT_PATTERNS = tuple(pattern.lower() for pattern in (  # Text patterns indicating international product, lowercased once at import
+    "tributos de importação estão incluídos",  # Import taxes included text
+    "Você não terá custos extras",  # No extra costs text
+    "produto internacional",  # International product text
+    "foreign seller",  # Foreign seller text
+))  # Tuple of lowercased patterns matched against the lowercased page text
+
+# Contextual Selector Constants:
+CONTEXTUAL_OLD_PRICE_SELECTORS = HTML_SELECTORS["old_price"] + (  # Old price selectors extended with apex and basisPrice support
+    ("span", {"class": "a-price a-text-price apex-basisprice-value"}),  # Apex basis price container with specific class
+    ("span", {"class": lambda value: bool(value) and "basisprice" in value.lower()}),  # Generic basisPrice container fallback
+)  # Tuple of selectors used for contextual old price scanning
+
 # Output Directory Constants:
 OUTPUT_DIRECTORY = "./Outputs/"  # Base directory for storing scraped data and media files
 
+# Environment File Constants:
+ENV_FILE_PATH = Path(__file__).parent / ".env"  # Path to the .env file next to this module, resolved once at import
+
 # Browser Constants:
 CHROME_PROFILE_PATH = os.getenv("CHROME_PROFILE_PATH", "")  # Chrome user profile path from environment variable
 CHROME_EXECUTABLE_PATH = os.getenv("CHROME_EXECUTABLE_PATH", "")  # Chrome executable path from environment variable
 HEADLESS = os.getenv("HEADLESS", "False").lower() == "true"  # Run browser in headless mode flag from environment
+REUSE_BROWSER = os.getenv("REUSE_BROWSER", "False").lower() == "true"  # Keep one browser alive across Amazon instances flag from environment
 PAGE_LOAD_TIMEOUT = 30000  # Maximum time in milliseconds to wait for page load
 NETWORK_IDLE_TIMEOUT = 5000  # Maximum time in milliseconds to wait for network idle state
 SCROLL_PAUSE_TIME = 0.5  # Pause duration in seconds between scroll steps
 SCROLL_STEP = 300  # Number of pixels to scroll per step for lazy loading
 MAX_VIDEO_DOWNLOAD_RETRIES = 8  # Maximum retry attempts for Amazon CDN video downloads
 BASE_VIDEO_DOWNLOAD_DELAY_SECONDS = 2  # Base delay in seconds used for exponential backoff
-VIDEO_DOWNLOAD_MIN_PACING_SECONDS = 1.5  # Minimum pacing delay between sequential video downloads
-VIDEO_DOWNLOAD_MAX_PACING_SECONDS = 4.0  # Maximum pacing delay between sequential video downloads
+VIDEO_DOWNLOAD_MIN_PACING_SECONDS = 1.5  # Minimum pacing delay between video download starts
+VIDEO_DOWNLOAD_MAX_PACING_SECONDS = 4.0  # Maximum pacing delay between video download starts
+VIDEO_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # Bytes read from the stream and written to disk per iteration when downloading videos
+VIDEO_CONTENT_TYPE_EXTENSIONS = (  # Content-type tokens mapped to video file extensions, in matching priority order
+    ("mp4", ".mp4"),  # MP4 video
+    ("webm", ".webm"),  # WebM video
+    ("quicktime", ".mov"),  # QuickTime video
+    ("mov", ".mov"),  # MOV video
+)  # Tuple of (content-type token, extension) pairs
+MAX_CONCURRENT_SCRAPES = 4  # Maximum number of products parsed and downloaded concurrently by scrape_many
+MAX_CONCURRENT_IMAGE_DOWNLOADS = 8  # Maximum number of product images downloaded concurrently
+MAX_CONCURRENT_VIDEO_DOWNLOADS = 2  # Maximum number of product videos downloaded concurrently, kept low to avoid Amazon CDN throttling
 
 # Template Constants:
 PRODUCT_DESCRIPTION_TEMPLATE = """Product Name: {product_name}
@@ -160,6 +209,13 @@ Description: {description}
 
 🛒 Encontre na Amazon:
 👉 {url}"""  # Template for product description text file with placeholders for formatting
+OUTPUT_RESULT_TEMPLATE = (  # Terminal summary printed by output_result, with the color codes resolved once at import
+    f"{BackgroundColors.GREEN}Scraping successful! Product data:{Style.RESET_ALL}\n"
+    f"  {BackgroundColors.CYAN}Name:{Style.RESET_ALL} {{name}}\n"
+    f"  {BackgroundColors.CYAN}Price:{Style.RESET_ALL} {{current_price}}\n"
+    f"  {BackgroundColors.CYAN}Files:{Style.RESET_ALL} {{downloaded_files}} downloaded"
+)  # Template for successful scraping result output with placeholders for formatting
+TIMESTAMP_FORMAT = "%d/%m/%Y - %H:%M:%S"  # strftime format for the start and finish times printed by main()
 
 # Logger Setup:
 logger = Logger(f"./Logs/{Path(__file__).stem}.log", clean=True)  # Create a Logger instance
@@ -173,6 +229,7 @@ SOUND_COMMANDS = {
     "Windows": "start",
 }  # The commands to play a sound for each operating system
 SOUND_FILE = "./.assets/Sounds/NotificationSound.wav"  # The path to the sound file
+CURRENT_OS = platform.system()  # The current operating system, resolved once at import
 
 # RUN_FUNCTIONS:
 RUN_FUNCTIONS = {
@@ -183,6 +240,51 @@ RUN_FUNCTIONS = {
 # Classes Definitions:
 
 
+class BrowserPool:
+    """
+    Holds a single Playwright browser shared by Amazon scraper instances when REUSE_BROWSER
+    is enabled, so the Chrome cold start is paid once per process instead of once per product.
+    """
+
+    playwright: Optional[Any] = None  # Shared Playwright instance
+    browser: Optional[Any] = None  # Shared browser instance
+
+
+    @classmethod
+    def register(cls, playwright: Any, browser: Any) -> None:
+        """
+        Stores a freshly launched browser for reuse and schedules its shutdown at exit.
+
+        :param playwright: Playwright instance that launched the browser
+        :param browser: Browser instance to share across scraper instances
+        :return: None
+        """
+
+        cls.playwright = playwright  # Store shared Playwright instance
+        cls.browser = browser  # Store shared browser instance
+        atexit.register(cls.shutdown)  # Close the shared browser when the program terminates
+
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Closes the shared browser and stops its Playwright instance.
+
+        :return: None
+        """
+
+        try:  # Attempt to close shared resources with error handling
+            if cls.browser:  # Verify if shared browser exists
+                cls.browser.close()  # Close the shared browser
+            if cls.playwright:  # Verify if shared playwright instance exists
+                cls.playwright.stop()  # Stop the shared playwright context
+        except Exception as e:  # Catch any exceptions during shutdown
+            print(f"{BackgroundColors.YELLOW}Warning during shared browser shutdown: {e}{Style.RESET_ALL}")  # Warn user about shutdown issues without failing
+        finally:  # Always reset the pool state
+            cls.playwright = None  # Reset shared Playwright instance
+            cls.browser = None  # Reset shared browser instance
+
+
 class Amazon:
     """
     A web scraper class for extracting product information from Amazon Brasil using
@@ -215,6 +317,10 @@ class Amazon:
         self.playwright: Optional[Any] = None  # Placeholder for Playwright instance
         self.browser: Optional[Any] = None  # Placeholder for browser instance
         self.page: Optional[Any] = None  # Placeholder for page object
+        self.soup: Optional[BeautifulSoup] = None  # Cached parse tree shared by all extractors
+        self.soup_html_content: Optional[str] = None  # HTML string the cached parse tree was built from
+        self.media_tags: Optional[Dict[str, List[Tag]]] = None  # Cached media tag buckets shared by image, video and asset discovery
+        self.media_tags_soup: Optional[BeautifulSoup] = None  # Parse tree the cached media tag buckets were collected from
 
         verbose_output(  # Output initialization message to user
             f"{BackgroundColors.GREEN}Amazon scraper initialized with URL: {BackgroundColors.CYAN}{url}{Style.RESET_ALL}"
@@ -238,6 +344,15 @@ class Amazon:
         )  # End of verbose output call
 
         try:  # Attempt to launch browser with error handling
+            if REUSE_BROWSER and BrowserPool.browser is not None:  # Verify if a shared browser is already running
+                self.browser = BrowserPool.browser  # Reuse the shared browser instead of cold-starting Chrome
+                self.page = self.browser.new_page()  # Create new browser page/tab
+                self.page.set_viewport_size({"width": 1920, "height": 1080})  # Set viewport dimensions to standard Full HD resolution
+                verbose_output(  # Output reuse message
+                    f"{BackgroundColors.GREEN}Reusing shared browser instance.{Style.RESET_ALL}"
+                )  # End of verbose output call
+                return  # Skip launching a new browser
+
             self.playwright = sync_playwright().start()  # Start Playwright synchronous context manager
             playwright_obj = cast(Any, self.playwright)  # Cast Playwright instance to Any for static type verifiers
             
@@ -266,6 +381,9 @@ class Amazon:
             
             if self.browser is None:  # Validate browser instance was created
                 raise Exception("Failed to launch browser instance")  # Raise exception if browser is None
+
+            if REUSE_BROWSER:  # Verify if the browser should be kept alive for later instances
+                BrowserPool.register(self.playwright, self.browser)  # Hand the browser over to the shared pool
             
             self.page = self.browser.new_page()  # Create new browser page/tab
             
@@ -297,6 +415,11 @@ class Amazon:
         try:  # Attempt to close browser resources with error handling
             if self.page:  # Verify if page instance exists
                 self.page.close()  # Close the browser page
+            if REUSE_BROWSER and self.browser is not None and self.browser is BrowserPool.browser:  # Verify if the browser belongs to the shared pool
+                verbose_output(  # Output status message
+                    f"{BackgroundColors.GREEN}Page closed, keeping shared browser alive.{Style.RESET_ALL}"
+                )  # End of verbose output call
+                return  # Leave the shared browser running for the next instance
             if self.browser:  # Verify if browser instance exists
                 self.browser.close()  # Close the browser
             if self.playwright:  # Verify if playwright instance exists
@@ -465,8 +588,12 @@ class Amazon:
                 print(f"{BackgroundColors.RED}Local HTML file not found at: {self.local_html_path}{Style.RESET_ALL}")  # Alert user file not found
                 return None  # Return None if file doesn't exist
             
-            with open(self.local_html_path, "r", encoding="utf-8") as file:  # Open file for reading with UTF-8 encoding
-                html_content = file.read()  # Read entire file content into string
+            html_content = ""  # Initialize HTML content for empty files, which cannot be memory-mapped
+            if os.path.getsize(self.local_html_path) > 0:  # Verify if file has content to map
+                with open(self.local_html_path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:  # Map file read-only into memory
+                    html_content = str(mapped_file, "utf-8")  # Decode UTF-8 straight from the mapped pages into a string
+            if "\r" in html_content:  # Verify if file uses Windows or classic Mac line endings
+                html_content = html_content.replace("\r\n", "\n").replace("\r", "\n")  # Normalize line endings as text-mode reading did
             
             verbose_output(  # Output success message with content length
                 f"{BackgroundColors.GREEN}Local HTML loaded successfully ({len(html_content)} characters).{Style.RESET_ALL}"
@@ -490,7 +617,7 @@ class Amazon:
             element = soup.find(tag, attrs)  # Search for element matching selector
             if element:  # Verify if element was found
                 product_name = element.get_text(strip=True)  # Extract and strip whitespace from text
-                product_name = re.sub(r"\s+", " ", product_name)  # Normalize multiple spaces to single space
+                product_name = WHITESPACE_PATTERN.sub(" ", product_name)  # Normalize multiple spaces to single space
                 verbose_output(  # Output found product name
                     f"{BackgroundColors.GREEN}Product name found: {BackgroundColors.CYAN}{product_name}{Style.RESET_ALL}"
                 )  # End of verbose output call
@@ -514,10 +641,10 @@ class Amazon:
             return None  # Return None for empty input
         
         normalized = price_text.strip()  # Strip leading/trailing whitespace
-        normalized = re.sub(r"[R$€£¥]", "", normalized)  # Remove currency symbols
+        normalized = CURRENCY_SYMBOLS_PATTERN.sub("", normalized)  # Remove currency symbols
         normalized = normalized.replace("\u00A0", " ").strip()  # Remove non-breaking spaces
         
-        match = re.search(r"([0-9.]+)[,.]([0-9]{2})", normalized)  # Match pattern: digits with dots + comma/dot + 2 digits
+        match = BRAZILIAN_CURRENCY_PATTERN.search(normalized)  # Match pattern: digits with dots + comma/dot + 2 digits
         if not match:  # Verify if pattern was found
             return None  # Return None if no match found
         
@@ -557,16 +684,9 @@ class Amazon:
                     )  # End of verbose output call
                     return True  # Return True if badge found
             
-            import_text_patterns = [  # List of text patterns indicating international product
-                "tributos de importação estão incluídos",  # Import taxes included text
-                "Você não terá custos extras",  # No extra costs text
-                "produto internacional",  # International product text
-                "foreign seller",  # Foreign seller text
-            ]  # End of patterns list
-            
             page_text = soup.get_text().lower()  # Get all page text in lowercase
-            for pattern in import_text_patterns:  # Iterate through text patterns
-                if pattern.lower() in page_text:  # Verify if pattern exists in page text
+            for pattern in INTERNATIONAL_TEXT_PATTERNS:  # Iterate through lowercased text patterns
+                if pattern in page_text:  # Verify if pattern exists in page text
                     verbose_output(  # Output detection message
                         f"{BackgroundColors.CYAN}International import text detected.{Style.RESET_ALL}"
                     )  # End of verbose output call
@@ -595,7 +715,7 @@ class Amazon:
                 f"{BackgroundColors.CYAN}Adding International prefix to product name.{Style.RESET_ALL}"
             )  # End of verbose output call
             product_name = f"International - {product_name}"  # Add International prefix
-            product_name = re.sub(r"\s+", " ", product_name)  # Normalize spaces after prefix addition
+            product_name = WHITESPACE_PATTERN.sub(" ", product_name)  # Normalize spaces after prefix addition
             product_name = product_name.strip()  # Remove leading/trailing whitespace
 
         return product_name  # Return modified and normalized product name
@@ -647,15 +767,15 @@ class Amazon:
         def is_current_price_container(price_container: Tag) -> bool:  # Define helper to ignore containers used by current price markup.
             class_tokens = cast(List[str], price_container.get("class") or []) if price_container.has_attr("class") else []  # Resolve class token list for the candidate container.
             class_text = " ".join(class_tokens)  # Build normalized class string for token matching.
-            return bool(re.search(r"priceToPay|reinventPricePriceToPayMargin|aok-align-center", class_text, re.IGNORECASE))  # Return whether class tokens match current-price patterns.
+            return bool(CURRENT_PRICE_CLASS_PATTERN.search(class_text))  # Return whether class tokens match current-price patterns.
 
         def is_old_price_container(price_container: Tag) -> bool:  # Define helper to keep only containers that look like old/list price markup.
             class_tokens = cast(List[str], price_container.get("class") or []) if price_container.has_attr("class") else []  # Resolve class token list for candidate filtering.
             class_text = " ".join(class_tokens)  # Build normalized class string for class-based filtering.
-            if re.search(r"a-text-price|basisPrice|apex-basisprice-value", class_text, re.IGNORECASE):  # Verify class string contains allowed old-price tokens.
+            if OLD_PRICE_CLASS_PATTERN.search(class_text):  # Verify class string contains allowed old-price tokens.
                 return True  # Return acceptance when class token criteria are satisfied.
             container_text = extract_text_from_container(price_container)  # Resolve candidate text for textual fallback filtering.
-            return "R$" in container_text and bool(re.search(r"De:|List Price|Preço", container_text, re.IGNORECASE))  # Return acceptance for textual old-price signals.
+            return "R$" in container_text and bool(OLD_PRICE_TEXT_PATTERN.search(container_text))  # Return acceptance for textual old-price signals.
 
         current_price_container = None  # Initialize reference to current-price container.
         for current_tag, current_attrs in HTML_SELECTORS["current_price"]:  # Iterate through current-price selectors in priority order.
@@ -674,11 +794,10 @@ class Amazon:
                     contextual_nodes.append(cast(Tag, anchor_node.next_sibling))  # Register next sibling to search nearby right branch.
                 anchor_node = anchor_node.parent if isinstance(anchor_node.parent, Tag) else None  # Move upward to broader contextual container.
 
-        contextual_old_selectors = list(HTML_SELECTORS["old_price"]) + [("span", {"class": "a-price a-text-price apex-basisprice-value"}), ("span", {"class": re.compile(r".*basisPrice.*", re.IGNORECASE)})]  # Extend selector set with apex and basisPrice support.
         old_price_tuple: Optional[Tuple[str, str]] = None  # Initialize old-price tuple placeholder.
 
         for context_node in contextual_nodes:  # Iterate through contextual nodes from closest to farthest.
-            for old_tag, old_attrs in contextual_old_selectors:  # Iterate through prioritized old-price selectors for current context.
+            for old_tag, old_attrs in CONTEXTUAL_OLD_PRICE_SELECTORS:  # Iterate through prioritized old-price selectors for current context.
                 contextual_candidates = context_node.find_all(old_tag, old_attrs)  # Collect contextual candidates for the active selector.
                 for candidate in contextual_candidates:  # Iterate through all contextual candidates in DOM order.
                     if not isinstance(candidate, Tag):  # Verify candidate type before processing.
@@ -732,7 +851,7 @@ class Amazon:
                         extracted_discount_value: Optional[float] = None  # Initialize extracted discount numeric placeholder.
                         if real_discount_element and isinstance(real_discount_element, Tag):  # Verify scraped discount element exists in DOM.
                             extracted_discount_text = real_discount_element.get_text(strip=True)  # Extract raw scraped discount text.
-                            extracted_discount_match = re.search(r"(\d+(?:[\.,]\d+)?)", extracted_discount_text)  # Parse numeric component from scraped discount text.
+                            extracted_discount_match = DISCOUNT_NUMBER_PATTERN.search(extracted_discount_text)  # Parse numeric component from scraped discount text.
                             if extracted_discount_match:  # Verify numeric component exists in scraped discount text.
                                 extracted_discount_value = float(extracted_discount_match.group(1).replace(",", "."))  # Convert scraped discount number to float.
                         if extracted_discount_value is None:  # Verify scraped discount is unavailable for reliable output.
@@ -793,16 +912,10 @@ class Amazon:
         for tag, attrs in HTML_SELECTORS["description"]:  # Iterate through prioritized selectors
             desc_container = soup.find(tag, attrs)  # Search for description container
             if desc_container:  # Verify if container was found
-                description_parts = []  # Initialize list for description parts
-                
-                for element in desc_container.find_all(["p", "li", "span", "div"]):  # Find all text-containing elements
-                    text = element.get_text(strip=True)  # Extract text with stripped whitespace
-                    if text and len(text) > 10:  # Filter out very short or empty text
-                        description_parts.append(text)  # Add text to parts list
+                description = " ".join(text for text in desc_container.stripped_strings if len(text) > 10)  # Join each text node from a single walk, filtering out very short text
                 
-                if description_parts:  # Verify if any parts were collected
-                    description = " ".join(description_parts)  # Join all parts with spaces
-                    description = re.sub(r"\s+", " ", description)  # Normalize multiple spaces
+                if description:  # Verify if any parts were collected
+                    description = WHITESPACE_PATTERN.sub(" ", description)  # Normalize multiple spaces
                     verbose_output(  # Output found description preview
                         f"{BackgroundColors.GREEN}Description found: {BackgroundColors.CYAN}{description[:100]}...{Style.RESET_ALL}"
                     )  # End of verbose output call
@@ -843,22 +956,15 @@ class Amazon:
                 )  # End of verbose output call
                 return details_dict  # Return empty dictionary
             
-            rows = details_table.find_all("tr")  # Find all table rows
-            for row in rows:  # Iterate through each row
-                try:  # Attempt to extract row data
-                    key_cell = row.find("th", {"class": "prodDetSectionEntry"})  # Find key cell
-                    value_cell = row.find("td", {"class": "prodDetAttrValue"})  # Find value cell
-                    
-                    if key_cell and value_cell:  # Verify if both cells exist
-                        key = key_cell.get_text(strip=True)  # Extract key text
-                        value = value_cell.get_text(strip=True)  # Extract value text
-                        
-                        key = re.sub(r"\s+", " ", key)  # Normalize key spacing
-                        value = re.sub(r"\s+", " ", value)  # Normalize value spacing
-                        
-                        details_dict[key] = value  # Add key-value pair to dictionary
-                except Exception as e:  # Catch exceptions during row extraction
-                    continue  # Skip row on error
+            row_cells = (  # Lazily pair key and value cells of each table row
+                (row.find("th", {"class": "prodDetSectionEntry"}, recursive=False), row.find("td", {"class": "prodDetAttrValue"}, recursive=False))  # Find key and value cells among the row's direct children only
+                for row in details_table.find_all("tr")  # Iterate through all table rows
+            )  # End of row cells generator
+            details_dict = {  # Build details dictionary in a single pass
+                WHITESPACE_PATTERN.sub(" ", key_cell.get_text(strip=True)): WHITESPACE_PATTERN.sub(" ", value_cell.get_text(strip=True))  # Map normalized key text to normalized value text
+                for key_cell, value_cell in row_cells  # Iterate through paired row cells
+                if key_cell and value_cell  # Keep only rows where both cells exist
+            }  # End of details dictionary comprehension
             
             verbose_output(  # Output success message with count
                 f"{BackgroundColors.GREEN}Extracted {BackgroundColors.CYAN}{len(details_dict)}{BackgroundColors.GREEN} product details.{Style.RESET_ALL}"
@@ -879,13 +985,14 @@ class Amazon:
         """
         
         image_urls: List[str] = []  # Initialize empty list to store image URLs
-        seen_urls: set = set()  # Track URLs to avoid duplicates
+        normalized_urls: List[str] = []  # Collect normalized candidate URLs, deduplicated once after extraction
         
         verbose_output(f"{BackgroundColors.GREEN}Extracting image URLs from gallery...{Style.RESET_ALL}")  # Output status message
         
         try:  # Attempt image extraction with error handling
             candidate_urls: List[str] = []  # Initialize candidate URL collection
-            data_old_hires_tags: List[Tag] = [cast(Tag, tag) for tag in soup.find_all(attrs=HTML_SELECTORS["image_block"])]  # Collect all tags that expose high-resolution image URLs
+            media_tags = self.get_media_tags(soup)  # Get the media tags collected in a single tree walk
+            data_old_hires_tags: List[Tag] = media_tags["high_resolution"]  # Collect all tags that expose high-resolution image URLs
 
             for media_tag in data_old_hires_tags:  # Iterate through all tags containing data-old-hires
                 data_old_hires = cast(str, media_tag.get("data-old-hires", "")) if media_tag.has_attr("data-old-hires") else ""  # Get data-old-hires attribute if present
@@ -896,14 +1003,12 @@ class Amazon:
             if not candidate_urls:  # Verify if no data-old-hires URLs were found in the document
                 image_blocks: List[Tag] = []  # Initialize image_blocks list
 
-                for div in soup.find_all("div", id="imageBlock"):  # Find all divs with id=imageBlock
+                for div in media_tags["image_blocks"]:  # Iterate all divs with id=imageBlock
                     if div.has_attr("data-csa-c-content-id") and "mediaBlock-primaryView" in div["data-csa-c-content-id"]:  # Verify correct imageBlock by content ID
-                        image_blocks.append(cast(Tag, div))  # Add valid imageBlock to list
+                        image_blocks.append(div)  # Add valid imageBlock to list
 
-                if not image_blocks:  # Verify if no validated imageBlock was found
-                    fallback_block = soup.find("div", id="imageBlock")  # Try fallback imageBlock lookup
-                    if fallback_block:  # Verify if fallback imageBlock exists
-                        image_blocks.append(cast(Tag, fallback_block))  # Add fallback imageBlock to list
+                if not image_blocks and media_tags["image_blocks"]:  # Verify if no validated imageBlock was found but a fallback exists
+                    image_blocks.append(media_tags["image_blocks"][0])  # Add first imageBlock as fallback
 
                 if not image_blocks:  # Verify if valid image_block was found
                     verbose_output(f"{BackgroundColors.YELLOW}Gallery container not found.{Style.RESET_ALL}")  # Output warning if gallery not found
@@ -939,22 +1044,22 @@ class Amazon:
                     img_url = "https:" + img_url  # Prepend HTTPS protocol
                 elif img_url.startswith("/"):  # Verify absolute web path
                     img_url = "https://www.amazon.com.br" + img_url  # Build full URL
-                elif img_url.startswith("./") or (not img_url.startswith("http") and not os.path.isabs(img_url)):  # Verify relative path
+                elif not img_url.startswith("http") and not os.path.isabs(img_url):  # Verify relative path (also covers "./" prefixes)
                     if self.local_html_path:  # Verify if running on local HTML
                         img_url = os.path.abspath(os.path.join(os.path.dirname(self.local_html_path), img_url))  # Resolve local path
                     else:  # Live web scraping
                         img_url = urljoin(self.product_url, img_url)  # Resolve relative web URL
 
-                if img_url in seen_urls:  # Verify duplicate URL
-                    continue  # Skip duplicate URL
-
-                if img_url.startswith("http") or os.path.exists(img_url):  # Verify accessibility
-                    image_urls.append(img_url)  # Add URL to list
-                    seen_urls.add(img_url)  # Mark URL as seen
-                    verbose_output(f"{BackgroundColors.RED}Image found: {BackgroundColors.CYAN}{img_url}{Style.RESET_ALL}")  # Output found image
+                normalized_urls.append(img_url)  # Add normalized URL to candidates
         
         except Exception as e:  # Catch exceptions during extraction
             print(f"{BackgroundColors.YELLOW}Warning during image extraction: {e}{Style.RESET_ALL}")  # Warn user about exception
+
+        for img_url in dict.fromkeys(normalized_urls):  # Iterate through unique normalized URLs in first-seen order
+            if img_url.startswith("http") or os.path.exists(img_url):  # Verify accessibility
+                image_urls.append(img_url)  # Add URL to list
+                if VERBOSE:  # Avoid building the message when verbose output is disabled
+                    verbose_output(f"{BackgroundColors.RED}Image found: {BackgroundColors.CYAN}{img_url}{Style.RESET_ALL}")  # Output found image
         
         verbose_output(f"{BackgroundColors.GREEN}Found {BackgroundColors.CYAN}{len(image_urls)}{BackgroundColors.GREEN} images.{Style.RESET_ALL}")  # Output total images found
         
@@ -970,15 +1075,15 @@ class Amazon:
         :return: List of video URLs
         """
         
-        video_urls: List[str] = []  # Initialize empty list to store video URLs
-        seen_urls: set = set()  # Track URLs to avoid duplicates
+        video_candidates: List[str] = []  # Collect normalized video URLs, deduplicated once after extraction
         
         verbose_output(  # Output status message
             f"{BackgroundColors.GREEN}Extracting video URLs from page...{Style.RESET_ALL}"
         )  # End of verbose output call
         
         try:  # Attempt video extraction with error handling
-            hidden_video_inputs = soup.find_all("input", {"type": "hidden", "class": "video-url"})  # Find hidden inputs that store video URLs
+            media_tags = self.get_media_tags(soup)  # Get the media tags collected in a single tree walk
+            hidden_video_inputs = media_tags["video_inputs"]  # Get hidden inputs that store video URLs
             hidden_video_values = [cast(str, video_input.get("value", "")).strip() for video_input in hidden_video_inputs if cast(str, video_input.get("name", "")) == "" and cast(str, video_input.get("value", "")).strip().startswith("http")]  # Extract valid hidden input values with empty name and HTTP URL
 
             for video_url in hidden_video_values:  # Iterate through hidden input video URLs
@@ -990,19 +1095,15 @@ class Amazon:
                     normalized_video_url = "https://www.amazon.com.br" + normalized_video_url  # Build full URL
 
                 if normalized_video_url.startswith(("blob:", "data:")):  # Skip browser-local sources that cannot be fetched outside the page context
-                    verbose_output(
-                        f"{BackgroundColors.YELLOW}Skipping unsupported video source: {normalized_video_url}{Style.RESET_ALL}"
-                    )  # End of verbose output call
+                    if VERBOSE:  # Avoid building the message when verbose output is disabled
+                        verbose_output(
+                            f"{BackgroundColors.YELLOW}Skipping unsupported video source: {normalized_video_url}{Style.RESET_ALL}"
+                        )  # End of verbose output call
                     continue  # Continue to next video source
 
-                if normalized_video_url not in seen_urls:  # Verify URL is not duplicate
-                    video_urls.append(normalized_video_url)  # Add URL to list
-                    seen_urls.add(normalized_video_url)  # Mark URL as seen
-                    verbose_output(  # Output found video
-                        f"{BackgroundColors.CYAN}Video found: {normalized_video_url}{Style.RESET_ALL}"
-                    )  # End of verbose output call
+                video_candidates.append(normalized_video_url)  # Add URL to candidates
 
-            videos = soup.find_all("video")  # Find all video tags
+            videos = media_tags["videos"]  # Get all video tags
 
             for video in videos:  # Iterate through each video
                 video_url = None  # Initialize URL variable
@@ -1023,20 +1124,23 @@ class Amazon:
                         video_url = "https://www.amazon.com.br" + video_url  # Build complete URL
 
                     if video_url.startswith(("blob:", "data:")):  # Skip browser-local sources that cannot be fetched outside the page context
-                        verbose_output(
-                            f"{BackgroundColors.YELLOW}Skipping unsupported video source: {video_url}{Style.RESET_ALL}"
-                        )  # End of verbose output call
+                        if VERBOSE:  # Avoid building the message when verbose output is disabled
+                            verbose_output(
+                                f"{BackgroundColors.YELLOW}Skipping unsupported video source: {video_url}{Style.RESET_ALL}"
+                            )  # End of verbose output call
                         continue  # Continue to next video source
                     
-                    if video_url not in seen_urls:  # Verify if URL is not duplicate
-                        video_urls.append(video_url)  # Add URL to list
-                        seen_urls.add(video_url)  # Mark URL as seen
-                        verbose_output(  # Output found video
-                            f"{BackgroundColors.CYAN}Video found: {video_url}{Style.RESET_ALL}"
-                        )  # End of verbose output call
+                    video_candidates.append(video_url)  # Add URL to candidates
         
         except Exception as e:  # Catch any exceptions during video extraction
             print(f"{BackgroundColors.YELLOW}Warning during video extraction: {e}{Style.RESET_ALL}")  # Warn user about extraction issues
+
+        video_urls: List[str] = list(dict.fromkeys(video_candidates))  # Deduplicate video URLs preserving first-seen order
+        if VERBOSE:  # Avoid building the messages when verbose output is disabled
+            for video_url in video_urls:  # Iterate through unique video URLs
+                verbose_output(  # Output found video
+                    f"{BackgroundColors.CYAN}Video found: {video_url}{Style.RESET_ALL}"
+                )  # End of verbose output call
         
         verbose_output(  # Output total count
             f"{BackgroundColors.GREEN}Found {BackgroundColors.CYAN}{len(video_urls)}{BackgroundColors.GREEN} videos.{Style.RESET_ALL}"
@@ -1067,6 +1171,65 @@ class Amazon:
         )  # End of verbose_output call
 
 
+    def get_soup(self, html_content: str) -> BeautifulSoup:
+        """
+        Returns the parse tree for the given HTML, parsing it only the first time.
+        This is the only place the page HTML is handed to BeautifulSoup, so every extractor shares one parse.
+
+        :param html_content: Rendered HTML string
+        :return: BeautifulSoup object containing the parsed HTML
+        """
+
+        if self.soup is None or self.soup_html_content is not html_content:  # Verify if the cached tree is missing or was built from other HTML
+            self.soup = BeautifulSoup(html_content, HTML_PARSER)  # Parse HTML content into BeautifulSoup object
+            self.soup_html_content = html_content  # Remember which HTML the cached tree belongs to
+
+        return self.soup  # Return the cached parse tree
+
+
+    def get_media_tags(self, soup: BeautifulSoup) -> Dict[str, List[Tag]]:
+        """
+        Returns the media-related tags of the parse tree grouped by purpose, walking the tree only the first time.
+        Image discovery, video discovery and asset collection all read from these buckets instead of scanning the tree on their own.
+
+        :param soup: BeautifulSoup object containing the parsed HTML
+        :return: Dictionary mapping bucket names to the matching tags in document order
+        """
+
+        if self.media_tags is not None and self.media_tags_soup is soup:  # Verify if the buckets were already collected from this tree
+            return self.media_tags  # Return the cached buckets
+
+        media_tags: Dict[str, List[Tag]] = {  # Initialize one bucket per media lookup
+            "high_resolution": [],  # Tags exposing high-resolution image URLs
+            "image_blocks": [],  # Gallery imageBlock containers
+            "video_inputs": [],  # Hidden inputs that store video URLs
+            "videos": [],  # Video tags
+            "images": [],  # Image tags with a src attribute
+        }  # End of media tag buckets
+
+        for tag in soup.find_all(True):  # Walk every tag of the tree exactly once
+            tag = cast(Tag, tag)  # Narrow the element type for attribute access
+            if all(tag.has_attr(attribute) for attribute in HTML_SELECTORS["image_block"]):  # Verify if the tag exposes a high-resolution image URL
+                media_tags["high_resolution"].append(tag)  # Add tag to high-resolution bucket
+
+            if tag.name == "img":  # Verify if the tag is an image
+                if tag.has_attr("src"):  # Verify if the image has a src attribute
+                    media_tags["images"].append(tag)  # Add tag to images bucket
+            elif tag.name == "div":  # Verify if the tag is a div
+                if tag.get("id") == "imageBlock":  # Verify if the div is a gallery imageBlock
+                    media_tags["image_blocks"].append(tag)  # Add tag to image blocks bucket
+            elif tag.name == "video":  # Verify if the tag is a video
+                media_tags["videos"].append(tag)  # Add tag to videos bucket
+            elif tag.name == "input":  # Verify if the tag is an input
+                if tag.get("type") == "hidden" and "video-url" in tag.get("class", []):  # Verify if the input is a hidden video URL holder
+                    media_tags["video_inputs"].append(tag)  # Add tag to video inputs bucket
+
+        self.media_tags = media_tags  # Cache the buckets for the other media lookups
+        self.media_tags_soup = soup  # Remember which tree the buckets belong to
+
+        return media_tags  # Return the collected buckets
+
+
     def scrape_product_info(self, html_content: str) -> Optional[Dict[str, Any]]:
         """
         Scrapes product information from rendered HTML content.
@@ -1080,10 +1243,12 @@ class Amazon:
         )  # End of verbose output call
 
         try:  # Attempt parsing with error handling
-            soup = BeautifulSoup(html_content, "html.parser")  # Parse HTML content into BeautifulSoup object
+            soup = self.get_soup(html_content)  # Reuse the cached parse tree for the HTML content
             
             product_name = self.extract_product_name(soup)  # Extract product name
-            is_international = self.detect_international(soup)  # Detect international seller
+            is_international = HTML_SELECTORS["foreign_seller_badge"] in html_content  # Probe raw HTML for the foreign seller badge URL before walking the DOM
+            if not is_international:  # Verify if the badge URL was not found in the raw HTML
+                is_international = self.detect_international(soup)  # Fall back to DOM-based detection of import tax text
             if is_international:  # Verify if product is international
                 product_name = self.prefix_international_name(product_name)  # Add international prefix
             
@@ -1141,10 +1306,8 @@ class Amazon:
             true_string=f"{BackgroundColors.GREEN}Creating the {BackgroundColors.CYAN}{relative_directory_name}{BackgroundColors.GREEN} directory...{Style.RESET_ALL}"
         )  # End of verbose output call
 
-        if os.path.isdir(full_directory_name):  # Verify if directory already exists
-            return  # Exit early if directory exists
         try:  # Attempt directory creation
-            os.makedirs(full_directory_name)  # Create directory with all parent directories
+            os.makedirs(full_directory_name, exist_ok=True)  # Create directory with all parent directories, ignoring existing ones without a separate isdir check
         except OSError:  # Catch OS errors during creation
             print(f"{BackgroundColors.RED}Failed to create directory: {full_directory_name}{Style.RESET_ALL}")  # Alert user about creation failure
 
@@ -1185,12 +1348,12 @@ class Amazon:
         self.create_directory(assets_dir, "assets")  # Create assets subdirectory
 
         asset_map: Dict[str, str] = {}  # Maps original URL to local path  # Initialize empty dictionary to map original URLs to local paths
-        soup = BeautifulSoup(html_content, "html.parser")  # Parse HTML content into BeautifulSoup object
+        soup = self.get_soup(html_content)  # Reuse the cached parse tree instead of parsing the page again
 
-        img_tags = soup.find_all("img", src=True)  # Find all image tags with src attribute
+        img_tags = self.get_media_tags(soup)["images"]  # Get all image tags with src attribute from the shared media walk
         for idx, img in enumerate(img_tags, 1):  # Iterate with counter starting at 1
             try:  # Attempt asset download with error handling
-                img_url = cast(str, img.get("src", ""))  # Get image source URL as str
+                img_url = cast(str, img["src"])  # Get image source URL directly, as find_all already required a src attribute
                 if img_url.startswith("//"):  # Verify if protocol-relative URL
                     img_url = "https:" + img_url  # Add HTTPS protocol
                 elif img_url.startswith("/"):  # Verify if absolute path
@@ -1199,12 +1362,8 @@ class Amazon:
                 if not img_url.startswith("http"):  # Skip non-HTTP URLs
                     continue  # Skip to next image
 
-                parsed = urlparse(img_url)  # Parse URL to extract components
-                ext = os.path.splitext(parsed.path)[1] or ".jpg"  # Get extension or default to jpg
-                local_filename = f"asset_{idx}{ext}"  # Generate unique filename
-                local_path = os.path.join(assets_dir, local_filename)  # Build full local path
-
-                asset_map[img_url] = f"assets/{local_filename}"  # Map original URL to relative path
+                ext = os.path.splitext(urlsplit(img_url).path)[1] or ".jpg"  # Get extension from the URL path or default to jpg
+                asset_map[img_url] = f"assets/asset_{idx}{ext}"  # Map original URL to relative path
 
             except Exception as e:  # Catch exceptions during asset processing
                 verbose_output(  # Output error message
@@ -1233,12 +1392,13 @@ class Amazon:
         )  # End of verbose output call
 
         try:  # Attempt snapshot save with error handling
-            for original_url, local_path in asset_map.items():  # Iterate through asset mappings
-                html_content = html_content.replace(original_url, local_path)  # Replace original URL with local path
+            if asset_map:  # Verify if there are asset references to localize
+                asset_url_pattern = re.compile("|".join(re.escape(original_url) for original_url in sorted(asset_map, key=len, reverse=True)))  # Match any original URL, longest first so prefixes never win
+                html_content = asset_url_pattern.sub(lambda match: asset_map[match.group(0)], html_content)  # Replace every original URL with its local path in a single pass
             
             snapshot_path = os.path.join(output_dir, "index.html")  # Build snapshot file path
-            with open(snapshot_path, "w", encoding="utf-8") as file:  # Open file for writing with UTF-8 encoding
-                file.write(html_content)  # Write modified HTML content
+            with open(snapshot_path, "wb") as file:  # Open file for binary writing to bypass the text-layer buffering
+                file.write(html_content.encode("utf-8"))  # Encode the modified HTML once and write it in a single call
             
             verbose_output(  # Output success message
                 f"{BackgroundColors.GREEN}Snapshot saved to: {BackgroundColors.CYAN}{snapshot_path}{Style.RESET_ALL}"
@@ -1326,9 +1486,9 @@ class Amazon:
         if not text:  # If text is empty
             return text  # Return as is
         
-        text = re.sub(r"\*\*(.*?)\*\*", r"\1", text)  # Remove markdown bold formatting
+        text = MARKDOWN_BOLD_PATTERN.sub(r"\1", text)  # Remove markdown bold formatting
         
-        text = re.sub(r"\n{3,}", "\n\n", text)  # Replace 3 or more newlines with 2 newlines
+        text = EXCESS_NEWLINES_PATTERN.sub("\n\n", text)  # Replace 3 or more newlines with 2 newlines
         
         lines = text.split("\n")  # Split into lines
         cleaned_lines = []  # List to store cleaned lines
@@ -1338,7 +1498,7 @@ class Amazon:
                 cleaned_lines.append(cleaned_line)  # Add cleaned line
         
         text = "\n".join(cleaned_lines)  # Join cleaned lines
-        text = re.sub(r"\n{3,}", "\n\n", text)  # Ensure no more than 2 consecutive newlines
+        text = EXCESS_NEWLINES_PATTERN.sub("\n\n", text)  # Ensure no more than 2 consecutive newlines
         
         return text.strip()  # Return cleaned text
     
@@ -1354,18 +1514,13 @@ class Amazon:
         if not text:  # Verify if text is empty or None
             return text  # Return as-is if empty
 
-        sentences = re.split(r"([.!?]\s*)", text)  # Keep the delimiters
+        parts = SENTENCE_DELIMITER_PATTERN.split(text)  # Split into sentences at even indices and delimiters at odd indices
+        parts[::2] = [sentence[:1].upper() + sentence[1:].lower() for sentence in parts[::2]]  # Capitalize the first letter of every sentence in one slice assignment
 
-        result = []  # Initialize list to hold processed sentences
-        for i, sentence in enumerate(sentences):  # Iterate with index
-            if i % 2 == 0 and sentence:  # Process actual sentences (not delimiters)
-                sentence = sentence[0].upper() + sentence[1:].lower() if sentence else sentence  # Capitalize first letter
-            result.append(sentence)  # Add processed sentence to result
+        return "".join(parts)  # Join all sentences and delimiters back into a single string
 
-        return "".join(result)  # Join all sentences and delimiters back into a single string
 
-
-    def download_single_image(self, img_url, output_dir, image_count):
+    def download_single_image(self, img_url, output_dir, image_count, session: Optional[requests.Session] = None):
         """
         Downloads a single image to the specified output directory.
         Supports both HTTP downloads and local file copying.
@@ -1373,6 +1528,7 @@ class Amazon:
         :param img_url: URL of the image to download (HTTP URL or local path)
         :param output_dir: Directory to save the image
         :param image_count: Counter for generating unique filenames
+        :param session: Optional persistent HTTP session reusing pooled connections across images
         :return: Path to the downloaded file or None if download failed
         """
         
@@ -1395,7 +1551,7 @@ class Amazon:
                 filename = f"{image_count:02d}_{original_basename}{ext}"  # Generate filename with two-digit index prefix and original basename
                 filepath = os.path.join(output_dir, filename)
                 
-                shutil.copy2(local_img_path, filepath)
+                shutil.copyfile(local_img_path, filepath)  # Copy file contents only, letting the kernel copy fast path skip metadata syscalls
                 
                 verbose_output(
                     f"{BackgroundColors.GREEN}Copied: {BackgroundColors.CYAN}{filename}{Style.RESET_ALL}"
@@ -1403,7 +1559,7 @@ class Amazon:
                 
                 return filepath
             else:
-                img_response = requests.get(img_url, timeout=10)  # Download image directly from URL
+                img_response = (session or requests).get(img_url, timeout=10)  # Download image directly from URL, reusing pooled connections when a session is provided
                 img_response.raise_for_status()  # Raise exception on bad status
                 
                 parsed_url = urlparse(img_url)  # Parse URL
@@ -1460,7 +1616,7 @@ class Amazon:
                 response.raise_for_status()  # Raise exception immediately for non-retryable HTTP failure responses
 
                 with open(output_path, "wb") as file:  # Open destination file in binary mode for streamed writes
-                    for chunk in response.iter_content(chunk_size=8192):  # Iterate streamed response chunks using bounded chunk size
+                    for chunk in response.iter_content(chunk_size=VIDEO_DOWNLOAD_CHUNK_SIZE):  # Iterate streamed response chunks in large blocks to batch disk writes
                         if chunk:  # Verify that streamed chunk contains data bytes
                             file.write(chunk)  # Write streamed chunk bytes to destination file
 
@@ -1521,7 +1677,7 @@ class Amazon:
                 )  # End of verbose output call
                 return None  # Return None because the source cannot be downloaded externally
 
-            if video_url.startswith("file://") or (not video_url.startswith("http") and os.path.exists(video_url)):  # Verify if local file
+            if video_url.startswith("file://") or not video_url.startswith("http"):  # Verify if local file, leaving the existence check below as the only stat call
                 local_video_path = video_url.replace("file://", "")  # Remove file protocol
                 
                 if not os.path.exists(local_video_path):  # Verify file exists
@@ -1534,7 +1690,7 @@ class Amazon:
                 video_filename = f"video_{video_count}{file_ext}"  # Generate unique filename
                 video_path = os.path.join(output_dir, video_filename)  # Build full destination path
                 
-                shutil.copy2(local_video_path, video_path)  # Copy file preserving metadata
+                shutil.copyfile(local_video_path, video_path)  # Copy file contents only, letting the kernel copy fast path skip metadata syscalls
                 
                 verbose_output(  # Output success message
                     f"{BackgroundColors.GREEN}Video copied: {BackgroundColors.CYAN}{video_filename}{Style.RESET_ALL}"
@@ -1552,6 +1708,13 @@ class Amazon:
                 
                 ffmpeg_command = [  # Build ffmpeg command list
                     "ffmpeg",  # FFmpeg executable
+                    "-nostdin",  # Never wait for interactive input
+                    "-loglevel", "error",  # Only emit errors so the captured stderr stays small
+                    "-http_persistent", "1",  # Reuse HTTP connections across HLS segments
+                    "-http_multiple", "1",  # Fetch the next HLS segment on a second connection while the current one downloads
+                    "-reconnect", "1",  # Reconnect on dropped segment connections instead of failing the whole stream
+                    "-reconnect_streamed", "1",  # Allow reconnects on non-seekable streamed responses
+                    "-reconnect_delay_max", "5",  # Cap reconnect backoff in seconds
                     "-i", video_url,  # Input HLS URL
                     "-c", "copy",  # Copy streams without re-encoding
                     "-bsf:a", "aac_adtstoasc",  # Convert AAC format
@@ -1565,8 +1728,9 @@ class Amazon:
                 
                 result = subprocess.run(  # Execute ffmpeg command
                     ffmpeg_command,  # Command to run
-                    stdout=subprocess.PIPE,  # Capture stdout
-                    stderr=subprocess.PIPE,  # Capture stderr
+                    stdin=subprocess.DEVNULL,  # Detach stdin from the terminal
+                    stdout=subprocess.DEVNULL,  # Discard stdout, which is never read
+                    stderr=subprocess.PIPE,  # Capture stderr for failure reporting
                     timeout=300  # 5 minute timeout
                 )  # End of subprocess call
                 
@@ -1588,13 +1752,7 @@ class Amazon:
                         content_type = head_response.headers.get("content-type", "")  # Read content type from successful HEAD response headers
                     head_response.close()  # Close HEAD response to release network resources
                 
-                file_ext = ".mp4"  # Default extension
-                if "mp4" in content_type:  # Verify for MP4
-                    file_ext = ".mp4"  # Set MP4 extension
-                elif "webm" in content_type:  # Verify for WebM
-                    file_ext = ".webm"  # Set WebM extension
-                elif "quicktime" in content_type or "mov" in content_type:  # Verify for QuickTime
-                    file_ext = ".mov"  # Set MOV extension
+                file_ext = next((extension for token, extension in VIDEO_CONTENT_TYPE_EXTENSIONS if token in content_type), ".mp4")  # Resolve extension from the first matching content-type token, defaulting to MP4
                 
                 video_filename = f"video_{video_count}{file_ext}"  # Generate unique filename
                 video_path = os.path.join(output_dir, video_filename)  # Build full destination path
@@ -1633,10 +1791,17 @@ class Amazon:
         
         image_urls = self.find_image_urls(soup)  # Get all image URLs from gallery
         
-        for idx, img_url in enumerate(image_urls, 1):  # Iterate with counter starting at 1
-            image_path = self.download_single_image(img_url, output_dir, idx)  # Download image
-            if image_path:  # Verify if download succeeded
-                downloaded_images.append(image_path)  # Add to downloaded list
+        if image_urls:  # Verify if there are images to download
+            session = requests.Session()  # Create persistent HTTP session so images reuse TCP/TLS connections
+            adapter = HTTPAdapter(pool_connections=MAX_CONCURRENT_IMAGE_DOWNLOADS, pool_maxsize=MAX_CONCURRENT_IMAGE_DOWNLOADS)  # Size the connection pool to the number of download workers
+            session.mount("https://", adapter)  # Use pooled adapter for HTTPS image hosts
+            session.mount("http://", adapter)  # Use pooled adapter for HTTP image hosts
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_IMAGE_DOWNLOADS, len(image_urls))) as executor:  # Create bounded worker pool to overlap image requests
+                image_paths = executor.map(self.download_single_image, image_urls, [output_dir] * len(image_urls), range(1, len(image_urls) + 1), [session] * len(image_urls))  # Download images concurrently keeping gallery order and 1-based counters
+                downloaded_images = [image_path for image_path in image_paths if image_path]  # Keep only successful downloads
+
+            session.close()  # Close persistent session after all image downloads finish
         
         verbose_output(  # Output success message with count
             f"{BackgroundColors.GREEN}Downloaded {BackgroundColors.CYAN}{len(downloaded_images)}{BackgroundColors.GREEN} images.{Style.RESET_ALL}"
@@ -1662,24 +1827,34 @@ class Amazon:
         
         video_urls = self.find_video_urls(soup)  # Get all video URLs from gallery
 
-        session = requests.Session()  # Create persistent HTTP session for sequential Amazon CDN video downloads
+        if not video_urls:  # Verify if there are videos to download
+            verbose_output(  # Output success message with count
+                f"{BackgroundColors.GREEN}Downloaded {BackgroundColors.CYAN}0{BackgroundColors.GREEN} videos.{Style.RESET_ALL}"
+            )  # End of verbose output call
+            return downloaded_videos  # Return empty list when no videos were found
+
+        session = requests.Session()  # Create persistent HTTP session shared by the Amazon CDN video download workers
+        adapter = HTTPAdapter(pool_connections=MAX_CONCURRENT_VIDEO_DOWNLOADS, pool_maxsize=MAX_CONCURRENT_VIDEO_DOWNLOADS)  # Size the connection pool to the number of download workers
+        session.mount("https://", adapter)  # Use pooled adapter for HTTPS video hosts
+        session.mount("http://", adapter)  # Use pooled adapter for HTTP video hosts
         session.headers.update({  # Update persistent session headers with realistic browser-like values
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",  # Set realistic desktop browser user agent
             "Accept": "video/webm,video/mp4,video/*;q=0.9,*/*;q=0.8",  # Set acceptable content types prioritizing video resources
             "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",  # Set language preference matching Amazon Brasil traffic profile
-            "Connection": "keep-alive",  # Keep TCP connection open for sequential downloads
+            "Connection": "keep-alive",  # Keep TCP connections open across video downloads
             "Referer": self.product_url,  # Set referer to current Amazon product page URL
         })  # End of persistent session headers update
 
-        for idx, video_url in enumerate(video_urls, 1):  # Iterate with counter starting at 1
-            video_path = self.download_single_video(video_url, output_dir, idx, session=session)  # Download video using persistent session and resilient retry flow
-            if video_path:  # Verify if download succeeded
-                downloaded_videos.append(video_path)  # Add to downloaded list
-            if idx < len(video_urls):  # Verify whether more videos remain in the current sequential loop
-                pacing_delay = random.uniform(VIDEO_DOWNLOAD_MIN_PACING_SECONDS, VIDEO_DOWNLOAD_MAX_PACING_SECONDS)  # Compute randomized pacing delay between sequential video downloads
-                time.sleep(pacing_delay)  # Sleep between videos to reduce burst traffic to Amazon CDN
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_VIDEO_DOWNLOADS, len(video_urls))) as executor:  # Create bounded worker pool to overlap video transfers and ffmpeg runs
+            video_futures = []  # Keep futures in gallery order so results keep their 1-based counters
+            for idx, video_url in enumerate(video_urls, 1):  # Iterate with counter starting at 1
+                video_futures.append(executor.submit(self.download_single_video, video_url, output_dir, idx, session=session))  # Start video download using persistent session and resilient retry flow
+                if idx < len(video_urls):  # Verify whether more videos remain to be started
+                    pacing_delay = random.uniform(VIDEO_DOWNLOAD_MIN_PACING_SECONDS, VIDEO_DOWNLOAD_MAX_PACING_SECONDS)  # Compute randomized pacing delay between video download starts
+                    time.sleep(pacing_delay)  # Sleep between starts to reduce burst traffic to Amazon CDN
+            downloaded_videos = [video_path for video_path in (video_future.result() for video_future in video_futures) if video_path]  # Keep only successful downloads in gallery order
 
-        session.close()  # Close persistent session after sequential video download loop finishes
+        session.close()  # Close persistent session after all video downloads finish
         
         verbose_output(  # Output success message with count
             f"{BackgroundColors.GREEN}Downloaded {BackgroundColors.CYAN}{len(downloaded_videos)}{BackgroundColors.GREEN} videos.{Style.RESET_ALL}"
@@ -1717,13 +1892,14 @@ class Amazon:
             output_dir = self.create_output_directory(product_name_safe)  # Create product output directory
             self.product_data["product_name_safe"] = os.path.basename(output_dir)  # Store canonical directory name for main.py lookup
             
-            soup = BeautifulSoup(self.html_content, "html.parser")  # Parse HTML content
+            soup = self.get_soup(self.html_content)  # Reuse the parse tree built while scraping product info
+            self.get_media_tags(soup)  # Walk the tree for media tags once before the image and video workers read the buckets
             
-            images = self.download_product_images(soup, output_dir)  # Download all product images
-            downloaded_files.extend(images)  # Add image paths to downloaded files
-            
-            videos = self.download_product_videos(soup, output_dir)  # Download all product videos
-            downloaded_files.extend(videos)  # Add video paths to downloaded files
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:  # Run image and video downloads side by side
+                images_future = executor.submit(self.download_product_images, soup, output_dir)  # Download all product images
+                videos_future = executor.submit(self.download_product_videos, soup, output_dir)  # Download all product videos, keeping their paced starts
+                downloaded_files.extend(images_future.result())  # Add image paths to downloaded files
+                downloaded_files.extend(videos_future.result())  # Add video paths to downloaded files
             
             asset_map = self.collect_assets(self.html_content, output_dir)  # Collect page assets
             
@@ -1780,19 +1956,7 @@ class Amazon:
                     print(f"{BackgroundColors.RED}Failed to extract HTML content.{Style.RESET_ALL}")  # Alert user about extraction failure
                     return None  # Return None to indicate failure
             
-            self.product_data = self.scrape_product_info(self.html_content)  # Scrape product information
-            if not self.product_data:  # Validate product data was extracted
-                print(f"{BackgroundColors.RED}Failed to scrape product information.{Style.RESET_ALL}")  # Alert user about scraping failure
-                return None  # Return None to indicate failure
-            
-            downloaded_files = self.download_media()  # Download product media
-            self.product_data["downloaded_files"] = downloaded_files  # Add downloaded files to product data
-            
-            verbose_output(  # Output completion message
-                f"{BackgroundColors.BOLD}{BackgroundColors.GREEN}Scraping completed successfully!{Style.RESET_ALL}"
-            )  # End of verbose_output call
-            
-            return self.product_data  # Return complete product data dictionary
+            return self.process_html_content()  # Parse product information and download media
             
         except Exception as e:  # Catch any exceptions during scraping process
             print(f"{BackgroundColors.RED}Error during scraping: {e}{Style.RESET_ALL}")  # Alert user about error
@@ -1802,6 +1966,85 @@ class Amazon:
                 self.close_browser()  # Close browser and cleanup resources
 
 
+    def process_html_content(self) -> Optional[Dict[str, Any]]:
+        """
+        Parses the stored HTML content and downloads the product media.
+        Does not touch the browser, so it can run on a worker thread once the page has been rendered.
+
+        :return: Dictionary containing all scraped data and downloaded file paths
+        """
+
+        if not self.html_content:  # Validate HTML content exists
+            print(f"{BackgroundColors.RED}No HTML content available for processing.{Style.RESET_ALL}")  # Alert user no content
+            return None  # Return None to indicate failure
+
+        self.product_data = self.scrape_product_info(self.html_content)  # Scrape product information
+        if not self.product_data:  # Validate product data was extracted
+            print(f"{BackgroundColors.RED}Failed to scrape product information.{Style.RESET_ALL}")  # Alert user about scraping failure
+            return None  # Return None to indicate failure
+        
+        downloaded_files = self.download_media()  # Download product media
+        self.product_data["downloaded_files"] = downloaded_files  # Add downloaded files to product data
+        
+        verbose_output(  # Output completion message
+            f"{BackgroundColors.BOLD}{BackgroundColors.GREEN}Scraping completed successfully!{Style.RESET_ALL}"
+        )  # End of verbose_output call
+        
+        return self.product_data  # Return complete product data dictionary
+
+
+    @classmethod
+    def scrape_many(cls, urls: List[str], prefix: str = "", output_directory: str = OUTPUT_DIRECTORY, max_workers: int = MAX_CONCURRENT_SCRAPES) -> List[Optional[Dict[str, Any]]]:
+        """
+        Scrapes multiple product URLs sharing a single browser instance.
+        Pages are rendered one at a time on the calling thread, as the Playwright sync API is bound to the thread that started it,
+        while parsing and media downloads of already rendered products run concurrently on a thread pool.
+
+        :param urls: List of Amazon product URLs to scrape
+        :param prefix: Optional platform prefix for output directory naming (e.g., "Amazon")
+        :param output_directory: Output directory path for storing scraped data
+        :param max_workers: Maximum number of products processed concurrently
+        :return: List of product data dictionaries (or None for failures) in the same order as urls
+        """
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(urls)  # Initialize results list preserving input order
+        if not urls:  # Verify if there are URLs to scrape
+            return results  # Return empty results list
+
+        browser_owner = cls(urls[0], prefix=prefix, output_directory=output_directory)  # Create the instance that owns the shared browser
+        try:  # Attempt to launch the shared browser
+            browser_owner.launch_browser()  # Launch browser once for all URLs
+        except Exception:  # Browser launch failure is already reported by launch_browser
+            return results  # Return results list filled with None
+
+        futures: Dict[concurrent.futures.Future, int] = {}  # Map each submitted future to its URL index
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:  # Create bounded worker pool for post-render processing
+            try:  # Render every page on this thread
+                for index, url in enumerate(urls):  # Iterate through all product URLs
+                    try:  # Render this URL, so a failing page does not abort the batch
+                        scraper = cls(url, prefix=prefix, output_directory=output_directory)  # Create scraper instance for this URL
+                        scraper.page = browser_owner.page  # Reuse the shared browser page
+                        if not scraper.load_page():  # Load product page
+                            print(f"{BackgroundColors.RED}Failed to load product page: {url}{Style.RESET_ALL}")  # Alert user about load failure
+                            continue  # Skip to next URL
+                        scraper.auto_scroll()  # Scroll page to load lazy content
+                        scraper.wait_full_render()  # Wait for full page render
+                        scraper.html_content = scraper.get_rendered_html()  # Get rendered HTML content
+                        futures[executor.submit(scraper.process_html_content)] = index  # Parse and download media on a worker thread
+                    except Exception as e:  # Catch rendering errors for this URL, leaving its result as None
+                        print(f"{BackgroundColors.RED}Error during scraping of {url}: {e}{Style.RESET_ALL}")  # Alert user about the failed URL
+            finally:  # Always release the browser once rendering is done
+                browser_owner.close_browser()  # Close shared browser while workers finish processing
+
+            for future in concurrent.futures.as_completed(futures):  # Collect results as workers complete
+                try:  # Attempt to retrieve worker result
+                    results[futures[future]] = future.result()  # Store product data at the URL index
+                except Exception as e:  # Catch exceptions raised by worker
+                    print(f"{BackgroundColors.RED}Error during scraping of {urls[futures[future]]}: {e}{Style.RESET_ALL}")  # Alert user about worker failure
+
+        return results  # Return product data list in input order
+
+
 # Functions Definitions:
 
 
@@ -1830,10 +2073,11 @@ def output_result(result):
 
     if result:  # Verify if result dictionary is not None or empty
         print(  # Output formatted result message
-            f"{BackgroundColors.GREEN}Scraping successful! Product data:{Style.RESET_ALL}\n"
-            f"  {BackgroundColors.CYAN}Name:{Style.RESET_ALL} {result.get('name', 'N/A')}\n"
-            f"  {BackgroundColors.CYAN}Price:{Style.RESET_ALL} {result.get('current_price', 'N/A')}\n"
-            f"  {BackgroundColors.CYAN}Files:{Style.RESET_ALL} {len(result.get('downloaded_files', []))} downloaded"
+            OUTPUT_RESULT_TEMPLATE.format(  # Fill only the dynamic fields of the prebuilt template
+                name=result.get("name", "N/A"),  # Product name
+                current_price=result.get("current_price", "N/A"),  # Current product price
+                downloaded_files=len(result.get("downloaded_files", [])),  # Number of downloaded files
+            )  # End of format call
         )  # End of print statement
     else:  # Handle case when result is None or empty
         print(  # Output failure message
@@ -1863,10 +2107,8 @@ def verify_dot_env_file():
     :return: True if the .env file exists, False otherwise
     """
 
-    env_path = Path(__file__).parent / ".env"  # Path to the .env file
-    
-    if not verify_filepath_exists(env_path):  # If the .env file does not exist
-        print(f"{BackgroundColors.CYAN}.env{BackgroundColors.YELLOW} file not found at {BackgroundColors.CYAN}{env_path}{BackgroundColors.YELLOW}.{Style.RESET_ALL}")
+    if not verify_filepath_exists(ENV_FILE_PATH):  # If the .env file does not exist
+        print(f"{BackgroundColors.CYAN}.env{BackgroundColors.YELLOW} file not found at {BackgroundColors.CYAN}{ENV_FILE_PATH}{BackgroundColors.YELLOW}.{Style.RESET_ALL}")
         return False  # Return False
 
     return True  # Return True if the .env file exists
@@ -1884,16 +2126,16 @@ def to_seconds(obj):
         return None  # Signal failure to convert
     if isinstance(obj, (int, float)):  # Already numeric (seconds or timestamp)
         return float(obj)  # Return as float seconds
-    if hasattr(obj, "total_seconds"):  # Timedelta-like objects
-        try:  # Attempt to call total_seconds()
-            return float(obj.total_seconds())  # Use the total_seconds() method
-        except Exception:
-            pass  # Fallthrough on error
-    if hasattr(obj, "timestamp"):  # Datetime-like objects
-        try:  # Attempt to call timestamp()
-            return float(obj.timestamp())  # Use timestamp() to get seconds since epoch
-        except Exception:
-            pass  # Fallthrough on error
+    if isinstance(obj, datetime.datetime):  # Datetimes, the common case, dispatched before any attribute probing
+        return obj.timestamp()  # Use timestamp() to get seconds since epoch
+    try:  # Timedelta-like objects, a missing method raises AttributeError instead of needing a hasattr probe
+        return float(obj.total_seconds())  # Use the total_seconds() method
+    except AttributeError:  # Object has no total_seconds() method
+        pass  # Fallthrough to the next conversion
+    try:  # Other datetime-like objects, a missing method raises AttributeError instead of needing a hasattr probe
+        return float(obj.timestamp())  # Use timestamp() to get seconds since epoch
+    except AttributeError:  # Object has no timestamp() method
+        pass  # Fallthrough to the next conversion
     return None  # Couldn't convert
 
 
@@ -1936,10 +2178,9 @@ def calculate_execution_time(start_time, finish_time=None):
     if total_seconds < 0:  # Normalize negative durations
         total_seconds = abs(total_seconds)  # Use absolute value
 
-    days = int(total_seconds // 86400)  # Compute full days
-    hours = int((total_seconds % 86400) // 3600)  # Compute remaining hours
-    minutes = int((total_seconds % 3600) // 60)  # Compute remaining minutes
-    seconds = int(total_seconds % 60)  # Compute remaining seconds
+    minutes, seconds = divmod(int(total_seconds), 60)  # Split whole seconds into minutes and remaining seconds
+    hours, minutes = divmod(minutes, 60)  # Split minutes into hours and remaining minutes
+    days, hours = divmod(hours, 24)  # Split hours into full days and remaining hours
 
     if days > 0:  # Include days when present
         return f"{days}d {hours}h {minutes}m {seconds}s"  # Return formatted days+hours+minutes+seconds
@@ -1958,13 +2199,18 @@ def play_sound():
     :return: None
     """
 
-    current_os = platform.system()  # Get the current operating system
+    current_os = CURRENT_OS  # Get the current operating system resolved at import
     if current_os == "Windows":  # If the current operating system is Windows
         return  # Do nothing
 
     if verify_filepath_exists(SOUND_FILE):  # If the sound file exists
         if current_os in SOUND_COMMANDS:  # If the platform.system() is in the SOUND_COMMANDS dictionary
-            os.system(f"{SOUND_COMMANDS[current_os]} {SOUND_FILE}")  # Play the sound
+            try:  # Try to run the sound player
+                subprocess.run([SOUND_COMMANDS[current_os], SOUND_FILE], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)  # Play the sound directly, without spawning an intermediate shell
+            except OSError as e:  # If the player binary is missing or cannot be executed
+                print(
+                    f"{BackgroundColors.RED}Could not run {BackgroundColors.CYAN}{SOUND_COMMANDS[current_os]}{BackgroundColors.RED} to play the sound: {e}{Style.RESET_ALL}"
+                )
         else:  # If the platform.system() is not in the SOUND_COMMANDS dictionary
             print(
                 f"{BackgroundColors.RED}The {BackgroundColors.CYAN}{current_os}{BackgroundColors.RED} is not in the {BackgroundColors.CYAN}SOUND_COMMANDS dictionary{BackgroundColors.RED}. Please add it!{Style.RESET_ALL}"
@@ -1987,7 +2233,8 @@ def main():
         f"{BackgroundColors.BOLD}{BackgroundColors.GREEN}Welcome to the {BackgroundColors.CYAN}Amazon Scraper{BackgroundColors.GREEN} program!{Style.RESET_ALL}",
         end="\n",  # End with newline
     )  # End of print statement
-    start_time = datetime.datetime.now()  # Record program start time
+    start_time = datetime.datetime.now()  # Record program start time for display
+    start_monotonic = time.monotonic()  # Record monotonic start time for measuring the elapsed duration
 
     test_url = "https://www.amazon.com.br/product-example"  # Test URL  # Define test URL for scraping demonstration
     
@@ -2002,17 +2249,14 @@ def main():
     except Exception as e:  # Catch any exceptions during test execution
         print(f"{BackgroundColors.RED}Error during test: {e}{Style.RESET_ALL}")  # Alert user about test error
 
-    finish_time = datetime.datetime.now()  # Record program finish time
+    finish_time = datetime.datetime.now()  # Record program finish time for display
+    elapsed_seconds = time.monotonic() - start_monotonic  # Measure elapsed duration, unaffected by wall clock adjustments
     print(  # Display execution time statistics
-        f"{BackgroundColors.GREEN}Start time: {BackgroundColors.CYAN}{start_time.strftime('%d/%m/%Y - %H:%M:%S')}\n{BackgroundColors.GREEN}Finish time: {BackgroundColors.CYAN}{finish_time.strftime('%d/%m/%Y - %H:%M:%S')}\n{BackgroundColors.GREEN}Execution time: {BackgroundColors.CYAN}{calculate_execution_time(start_time, finish_time)}{Style.RESET_ALL}"
+        f"{BackgroundColors.GREEN}Start time: {BackgroundColors.CYAN}{start_time.strftime(TIMESTAMP_FORMAT)}\n{BackgroundColors.GREEN}Finish time: {BackgroundColors.CYAN}{finish_time.strftime(TIMESTAMP_FORMAT)}\n{BackgroundColors.GREEN}Execution time: {BackgroundColors.CYAN}{calculate_execution_time(elapsed_seconds)}{Style.RESET_ALL}"
     )  # End of print statement
     print(  # Display program completion message
         f"{BackgroundColors.BOLD}{BackgroundColors.GREEN}Program finished.{Style.RESET_ALL}"
     )  # End of print statement
-    
-    (  # Register sound playback function if enabled using ternary expression
-        atexit.register(play_sound) if RUN_FUNCTIONS["Play Sound"] else None  # Register play_sound to run at exit if enabled
-    )  # End of ternary expression
 
 
 if __name__ == "__main__":
@@ -2022,4 +2266,7 @@ if __name__ == "__main__":
     :return: None
     """
 
+    if RUN_FUNCTIONS.get("Play Sound"):  # Register before main() runs so the sound also plays on interrupted or failed runs
+        atexit.register(play_sound)  # Register play_sound to run at exit
+
     main()  # Call the main function
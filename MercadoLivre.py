@@ -25,6 +25,8 @@ Usage:
     3. Call the scrape method to extract product information:
             product_data = scraper.scrape()
     4. Media files are saved in ./Outputs/{Product Name}/ directory.
+    5. To scrape several products concurrently, call:
+            results = MercadoLivre.scrape_many(["https://mercadolivre.com.br/product-1", "https://mercadolivre.com.br/product-2"])
 
 Outputs:
     - Product data dictionary with all extracted information
@@ -34,7 +36,6 @@ Outputs:
 
 TODOs:
     - Add support for multiple product variations
-    - Implement retry mechanism for failed requests
     - Add data export to CSV/JSON formats
     - Implement rate limiting to respect website policies
 
@@ -53,7 +54,9 @@ Assumptions & Notes:
 """
 
 import atexit  # For playing a sound when the program finishes
+import concurrent.futures  # For scraping several products concurrently
 import datetime  # For getting the current date and time
+import importlib.util  # For detecting optional parser backends without importing them
 import json  # For parsing JSON data
 import os  # For running a command in the terminal
 import platform  # For getting the operating system name
@@ -62,11 +65,14 @@ import requests  # For making HTTP requests
 import shutil  # For copying files
 import subprocess  # For running ffmpeg commands
 import sys  # For system-specific parameters and functions
+import time  # For measuring the elapsed execution time with a monotonic clock
 from bs4 import BeautifulSoup, Tag  # For parsing HTML content
 from colorama import Style  # For coloring the terminal
 from Logger import Logger  # For logging output to both terminal and file
 from pathlib import Path  # For handling file paths
 from product_utils import normalize_product_name  # Centralized product dir name normalization
+from requests.adapters import HTTPAdapter  # For mounting retry-aware connection adapters on the session
+from urllib3.util.retry import Retry  # For retrying throttled or failed requests with exponential backoff
 from urllib.parse import urlparse  # For URL manipulation
 
 
@@ -84,9 +90,21 @@ class BackgroundColors:  # Colors for the terminal
 # Execution Constants:
 VERBOSE = False  # Set to True to output verbose messages
 
+# HTML Parser Constants:
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"  # Prefer the C-based lxml parser, falling back to the built-in parser when unavailable
+
 # Affiliate URL detection pattern (short affiliate redirect links)
 AFFILIATE_URL_PATTERN = r"https?://(?:www\.)?meli\.la/[A-Za-z0-9]+/?"  # Affiliate URL detection pattern for meli.la short links
 
+# Regex Constants:
+PRODUCT_BUTTON_TEXT_PATTERN = re.compile(r"Ir para produto", re.IGNORECASE)  # Match the "Ir para produto" button text on listing pages
+PRODUCT_LINK_PATTERN = re.compile(r"/p/|/MLB")  # Match hrefs pointing to product pages
+MARKDOWN_BOLD_PATTERN = re.compile(r"\*\*(.*?)\*\*")  # Match markdown bold formatting
+EXCESS_NEWLINES_PATTERN = re.compile(r"\n{3,}")  # Match three or more consecutive newlines
+LINE_EDGE_WHITESPACE_PATTERN = re.compile(r"[^\S\n]*\n[^\S\n]*")  # Match a newline together with the whitespace ending the previous line and starting the next one
+SENTENCE_DELIMITER_PATTERN = re.compile(r"([.!?]\s*)")  # Match sentence delimiters while keeping them in split results
+OLD_PRICE_CLASS_PATTERN = re.compile(r"andes-money-amount--previous")  # Match the class of the struck-through old price element
+
 # HTML Selectors Dictionary:
 HTML_SELECTORS = {
     "product_name": {"class": "ui-pdp-title"},  # CSS selector for product name element
@@ -94,7 +112,7 @@ HTML_SELECTORS = {
     "current_price_cents": {"class": "andes-money-amount__cents"},  # CSS selector for current price decimal part
     "price_container": {"class": "ui-pdp-container__row ui-pdp-container__row--price"},  # CSS selector for main price container
     "price_subtitles": {"class": "ui-pdp-price__subtitles"},  # CSS selector for subtitle price container to ignore
-    "old_price_element": {"name": "s", "attrs": {"class": re.compile(r"andes-money-amount--previous")}},  # <s> tag containing the old/struck-through price (andes-money-amount--previous class)
+    "old_price_element": {"name": "s", "attrs": {"class": OLD_PRICE_CLASS_PATTERN}},  # <s> tag containing the old/struck-through price (andes-money-amount--previous class)
     "current_price_element": {"name": "span", "attrs": {"itemprop": "offers"}},  # <span> with schema.org offers attribute identifying the active current price
     "discount_marker": {"name": "span", "attrs": {"data-andes-money-amount-discount": "true"}},  # Selector for discounted price marker element (data attribute)
     "discount": {"name": "span", "attrs": {"data-andes-money-amount-discount": "true"}},  # Selector for discount percentage element by data attribute
@@ -112,6 +130,24 @@ HTML_SELECTORS = {
 # Output Directory Constants:
 OUTPUT_DIRECTORY = "./Outputs/"  # The base path to the output directory
 
+# Environment File Constants:
+ENV_FILE_PATH = Path(__file__).parent / ".env"  # Path to the .env file next to this module, resolved once at import
+
+# Request Retry Constants:
+MAX_REQUEST_RETRIES = 5  # Maximum number of retries for throttled or failed requests
+REQUEST_RETRY_BACKOFF_FACTOR = 0.5  # Base delay in seconds for the exponential backoff between retries
+REQUEST_RETRY_BACKOFF_JITTER = 0.3  # Maximum random jitter in seconds added to each backoff delay
+REQUEST_RETRY_BACKOFF_MAX = 60  # Maximum backoff delay in seconds between retries
+REQUEST_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)  # HTTP status codes that trigger a retry
+MEDIA_REQUEST_RETRIES = 1  # Maximum number of retries for image and video requests, kept small so a failing media URL does not stall its download worker
+
+# Download Constants:
+VIDEO_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # Bytes read from the stream and written to disk per iteration when downloading videos
+
+# Concurrency Constants:
+MAX_CONCURRENT_IMAGE_DOWNLOADS = 8  # Maximum number of product images downloaded concurrently, also used as the media session's connection pool size
+MAX_CONCURRENT_SCRAPES = 5  # Maximum number of products fetched, parsed and downloaded concurrently by scrape_many
+
 # Template Constants:
 PRODUCT_DESCRIPTION_TEMPLATE = """Product Name: {product_name}
 
@@ -121,11 +157,7 @@ Description: {description}
 
 🛒 Encontre no Mercado Livre:
 👉 {url}"""
-
-# Logger Setup:
-logger = Logger(f"./Logs/{Path(__file__).stem}.log", clean=True)  # Create a Logger instance
-sys.stdout = logger  # Redirect stdout to the logger
-sys.stderr = logger  # Redirect stderr to the logger
+TIMESTAMP_FORMAT = "%d/%m/%Y - %H:%M:%S"  # strftime format for the start and finish times printed by main()
 
 # Sound Constants:
 SOUND_COMMANDS = {
@@ -134,6 +166,7 @@ SOUND_COMMANDS = {
     "Windows": "start",
 }  # The commands to play a sound for each operating system
 SOUND_FILE = "./.assets/Sounds/NotificationSound.wav"  # The path to the sound file
+CURRENT_OS = platform.system()  # The current operating system, resolved once at import
 
 # RUN_FUNCTIONS:
 RUN_FUNCTIONS = {
@@ -143,6 +176,28 @@ RUN_FUNCTIONS = {
 # Classes Definitions:
 
 
+class CappedRetry(Retry):
+    """
+    A urllib3 Retry policy that honors the server's Retry-After header, but never
+    waits longer than REQUEST_RETRY_BACKOFF_MAX seconds for it.
+    urllib3 applies backoff_max only to its own computed backoff and sleeps
+    for the full Retry-After value otherwise.
+    """
+
+    def get_retry_after(self, response):
+        """
+        Gets the value of the Retry-After header in seconds, capped at REQUEST_RETRY_BACKOFF_MAX.
+
+        :param response: The urllib3 response that carried the Retry-After header
+        :return: The number of seconds to wait, or None if the header is absent
+        """
+
+        retry_after = super().get_retry_after(response)  # Parse the Retry-After header (seconds or HTTP date)
+        if retry_after is None:  # If the server did not send a Retry-After header
+            return None  # Let urllib3 fall back to its own backoff
+        return min(retry_after, REQUEST_RETRY_BACKOFF_MAX)  # Cap the wait so a long Retry-After cannot stall the scrape
+
+
 class MercadoLivre:
     """
     A web scraper class for extracting product information from Mercado Livre.
@@ -152,6 +207,20 @@ class MercadoLivre:
     It also generates a marketing description file in a predefined template format.
     """
 
+    __slots__ = (
+        "url",  # Initial URL
+        "product_url",  # Actual product page URL
+        "local_html_path",  # Path to local HTML file for offline scraping
+        "html_content",  # HTML content for reuse
+        "prefix",  # Platform prefix for directory naming
+        "output_directory",  # Output directory path for this scraping session
+        "session",  # Session for making page requests
+        "media_session",  # Session for downloading images and videos
+        "product_data",  # Scraped product data
+        "soup",  # Cached parse tree
+        "soup_html_content",  # HTML string the cached parse tree was built from
+    )  # Fixed instance attributes, so no per-instance __dict__ is allocated when scraping many products
+
 
     def __init__(self, url, local_html_path=None, prefix="", output_directory=OUTPUT_DIRECTORY):
         """
@@ -174,7 +243,35 @@ class MercadoLivre:
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         })  # Set a realistic User-Agent to avoid being blocked
+        retry_adapter = HTTPAdapter(max_retries=CappedRetry(
+            total=MAX_REQUEST_RETRIES,  # Bound the number of retries per request
+            backoff_factor=REQUEST_RETRY_BACKOFF_FACTOR,  # Grow the delay exponentially between retries
+            backoff_jitter=REQUEST_RETRY_BACKOFF_JITTER,  # Spread retries so concurrent scrapes do not retry in lockstep
+            backoff_max=REQUEST_RETRY_BACKOFF_MAX,  # Cap the delay between retries
+            status_forcelist=REQUEST_RETRY_STATUS_CODES,  # Retry on rate limiting and transient server errors
+            allowed_methods=("GET", "HEAD"),  # Only retry idempotent requests
+            respect_retry_after_header=True,  # Wait as long as the server asks on 429/503 responses, up to REQUEST_RETRY_BACKOFF_MAX
+        ))  # Create an adapter that retries throttled and failed requests
+        self.session.mount("https://", retry_adapter)  # Use the retry adapter for HTTPS requests
+        self.session.mount("http://", retry_adapter)  # Use the retry adapter for HTTP requests
+        self.media_session = requests.Session()  # Create a separate session for image and video downloads
+        self.media_session.headers.update(self.session.headers)  # Send the same headers as the page requests
+        media_adapter = HTTPAdapter(
+            pool_connections=MAX_CONCURRENT_IMAGE_DOWNLOADS,  # Keep one connection pool per media host
+            pool_maxsize=MAX_CONCURRENT_IMAGE_DOWNLOADS,  # Size each pool to the number of image download workers
+            max_retries=Retry(
+                total=MEDIA_REQUEST_RETRIES,  # Retry a failing media URL only briefly
+                backoff_factor=REQUEST_RETRY_BACKOFF_FACTOR,  # Short delay before the retry
+                status_forcelist=REQUEST_RETRY_STATUS_CODES,  # Retry on rate limiting and transient server errors
+                allowed_methods=("GET", "HEAD"),  # Only retry idempotent requests
+                respect_retry_after_header=False,  # Do not let a long Retry-After stall a download worker
+            ),
+        )  # Create an adapter that fails media requests fast instead of backing off for minutes
+        self.media_session.mount("https://", media_adapter)  # Use the media adapter for HTTPS downloads
+        self.media_session.mount("http://", media_adapter)  # Use the media adapter for HTTP downloads
         self.product_data = {}  # Dictionary to store scraped product data
+        self.soup = None  # Cached parse tree shared by the product info extraction and the media download
+        self.soup_html_content = None  # HTML string the cached parse tree was built from
 
         verbose_output(
             f"{BackgroundColors.GREEN}MercadoLivre scraper initialized with URL: {BackgroundColors.CYAN}{url}{Style.RESET_ALL}"
@@ -201,9 +298,19 @@ class MercadoLivre:
             response = self.session.get(self.url, timeout=10)  # Make a GET request to the URL
             response.raise_for_status()  # Raise an exception for bad status codes
             
-            soup = BeautifulSoup(response.text, "html.parser")  # Parse the HTML content (use str to satisfy type verifiers)
+            has_button_text = PRODUCT_BUTTON_TEXT_PATTERN.search(response.text) is not None  # Probe the raw HTML once for the "Ir para produto" button text
             
-            ir_para_produto = soup.find(string=re.compile(r"Ir para produto", re.IGNORECASE))  # Find the "Ir para produto" text
+            if PRODUCT_LINK_PATTERN.search(urlparse(response.url).path) and not has_button_text:  # If the redirects already landed on a product page without an "Ir para produto" button
+                self.product_url = response.url  # Store the final redirected URL as the product URL
+                self.html_content = response.text  # Reuse the product page body so scrape_product_info does not fetch it again
+                verbose_output(
+                    f"{BackgroundColors.GREEN}Product URL found (redirect target): {BackgroundColors.CYAN}{self.product_url}{Style.RESET_ALL}"
+                )  # Output the success message
+                return self.product_url  # Return the product URL without parsing the page here
+            
+            soup = BeautifulSoup(response.text, HTML_PARSER)  # Parse the HTML content (use str to satisfy type verifiers)
+            
+            ir_para_produto = soup.find(string=PRODUCT_BUTTON_TEXT_PATTERN) if has_button_text else None  # Find the "Ir para produto" text node, skipping the text walk when the raw HTML does not contain it
             
             if ir_para_produto:  # If the button text was found
                 parent_link = ir_para_produto.find_parent("a")  # Find the parent anchor tag
@@ -217,7 +324,7 @@ class MercadoLivre:
                         )  # Output the success message
                         return self.product_url  # Return the product URL
             
-            product_links = soup.find_all("a", href=re.compile(r"/p/|/MLB"))  # Find all product links
+            product_links = soup.find_all("a", href=PRODUCT_LINK_PATTERN)  # Find all product links
             
             if product_links:  # If product links were found
                 first_link = product_links[0]  # Get the first product link
@@ -283,6 +390,22 @@ class MercadoLivre:
             return None  # Return None to indicate reading failed
 
 
+    def get_soup(self, html_content):
+        """
+        Returns the parse tree for the given HTML, parsing it only the first time.
+        The product info extractors and the media download share this tree instead of parsing the page twice.
+
+        :param html_content: HTML content string
+        :return: BeautifulSoup object containing the parsed HTML
+        """
+
+        if self.soup is None or self.soup_html_content is not html_content:  # If the cached tree is missing or was built from other HTML
+            self.soup = BeautifulSoup(html_content, HTML_PARSER)  # Parse the HTML content
+            self.soup_html_content = html_content  # Remember which HTML the cached tree belongs to
+
+        return self.soup  # Return the cached parse tree
+
+
     def extract_product_name(self, soup):
         """
         Extracts the product name from the parsed HTML soup.
@@ -344,71 +467,82 @@ class MercadoLivre:
             pass
 
 
-    def extract_current_price(self, soup):
+    def is_price_element(self, tag):
         """
-        Extracts the current price from the parsed HTML soup.
-        Current price is typically the first/primary price displayed.
+        Verifies if a tag is one of the price elements: the current price <span> with the
+        schema.org offers attribute or the struck-through old price <s> element.
         
-        :param soup: BeautifulSoup object containing the parsed HTML
-        :return: Tuple of (integer_part, decimal_part) for current price
+        :param tag: BeautifulSoup Tag to verify
+        :return: True if the tag is the current or the old price element, False otherwise
         """
         
-        current_el = soup.find(**HTML_SELECTORS["current_price_element"])  # Find current price element by schema.org offers attribute
+        if tag.name == HTML_SELECTORS["current_price_element"]["name"]:  # Verify if the tag could be the current price element
+            return tag.get("itemprop") == HTML_SELECTORS["current_price_element"]["attrs"]["itemprop"]  # Match the schema.org offers attribute
+        if tag.name == HTML_SELECTORS["old_price_element"]["name"]:  # Verify if the tag could be the old price element
+            return any(OLD_PRICE_CLASS_PATTERN.search(css_class) for css_class in tag.get("class", []))  # Match the andes-money-amount--previous class
+        return False  # Any other tag is not a price element
 
-        if not current_el or not isinstance(current_el, Tag):  # Verify if current price element was not found
-            verbose_output(f"{BackgroundColors.YELLOW}[DEBUG] Current price element not found{Style.RESET_ALL}")  # Log missing current price element
-            return "0", "00"  # Return zero defaults when current price element is absent
 
-        fraction = current_el.find("span", **HTML_SELECTORS["price_fraction"])  # Find fraction span within the current price element
+    def extract_price_parts(self, price_el, label, default):
+        """
+        Extracts the integer and decimal parts from a price element.
+        
+        :param price_el: BeautifulSoup Tag of the price element, or None if it was not found
+        :param label: Price label used in the debug messages ("Current" or "Old")
+        :param default: Tuple of (integer_part, decimal_part) returned when the price is not available
+        :return: Tuple of (integer_part, decimal_part)
+        """
+        
+        if not price_el or not isinstance(price_el, Tag):  # Verify if the price element was not found
+            verbose_output(f"{BackgroundColors.YELLOW}[DEBUG] {label} price element not found{Style.RESET_ALL}")  # Log missing price element
+            return default  # Return the defaults when the price element is absent
+
+        fraction = price_el.find("span", **HTML_SELECTORS["price_fraction"])  # Find fraction span within the price element
 
         if not fraction or not isinstance(fraction, Tag):  # Verify fraction element presence
-            verbose_output(f"{BackgroundColors.YELLOW}[DEBUG] Current price fraction not found{Style.RESET_ALL}")  # Log missing fraction element
-            return "0", "00"  # Return defaults when fraction is absent
+            verbose_output(f"{BackgroundColors.YELLOW}[DEBUG] {label} price fraction not found{Style.RESET_ALL}")  # Log missing fraction element
+            return default  # Return the defaults when fraction is absent
 
-        integer_part = fraction.get_text(strip=True)  # Extract integer portion of current price
-        cents = current_el.find("span", **HTML_SELECTORS["current_price_cents"])  # Find cents span within the current price element
+        integer_part = fraction.get_text(strip=True)  # Extract integer portion of the price
+        cents = price_el.find("span", **HTML_SELECTORS["current_price_cents"])  # Find cents span within the price element
         decimal_part = cents.get_text(strip=True) if cents and isinstance(cents, Tag) else "00"  # Extract decimal part or default to 00
 
-        verbose_output(f"{BackgroundColors.GREEN}[DEBUG] Current price extracted: {BackgroundColors.CYAN}{integer_part}.{decimal_part}{Style.RESET_ALL}")  # Log extracted current price
+        verbose_output(f"{BackgroundColors.GREEN}[DEBUG] {label} price extracted: {BackgroundColors.CYAN}{integer_part}.{decimal_part}{Style.RESET_ALL}")  # Log extracted price
 
         return integer_part, decimal_part  # Return the price parts
 
 
-    def extract_old_price(self, soup):
+    def extract_prices(self, soup):
         """
-        Extracts the old price from the parsed HTML soup.
-        Old price is typically the second price displayed (if exists).
+        Extracts the current and old prices from the parsed HTML soup.
+        Both price elements are located in a single walk of the document.
         
         :param soup: BeautifulSoup object containing the parsed HTML
-        :return: Tuple of (integer_part, decimal_part) for old price
+        :return: Tuple of (current_integer, current_decimal, old_integer, old_decimal), with "N/A" old parts when there is no old price
         """
         
-        old_el = soup.find(**HTML_SELECTORS["old_price_element"])  # Find old/struck-through price element by andes-money-amount--previous class
+        current_el = None  # Current price element (first <span itemprop="offers"> in the document)
+        old_el = None  # Old price element (first struck-through <s> in the document)
 
-        if not old_el or not isinstance(old_el, Tag):  # Verify if old price element was not found
-            verbose_output(f"{BackgroundColors.YELLOW}[DEBUG] Old price element not found. No old price available.{Style.RESET_ALL}")  # Log debug message when no old price present
-            return "N/A", "N/A"  # Return N/A to indicate no old price present
+        for price_el in soup.find_all(self.is_price_element):  # Walk the document once, collecting both price elements in document order
+            if price_el.name == HTML_SELECTORS["current_price_element"]["name"]:  # Verify if this is a current price element
+                current_el = current_el or price_el  # Keep the first current price element found
+            else:  # Otherwise it is an old price element
+                old_el = old_el or price_el  # Keep the first old price element found
 
-        fraction = old_el.find("span", **HTML_SELECTORS["price_fraction"])  # Find fraction span within the old price element
+        current_int, current_dec = self.extract_price_parts(current_el, "Current", ("0", "00"))  # Extract current price parts, defaulting to zero
+        old_int, old_dec = self.extract_price_parts(old_el, "Old", ("N/A", "N/A"))  # Extract old price parts, defaulting to N/A when there is no old price
 
-        if not fraction or not isinstance(fraction, Tag):  # Verify fraction element presence
-            verbose_output(f"{BackgroundColors.YELLOW}[DEBUG] Old price fraction not found{Style.RESET_ALL}")  # Log missing fraction element
-            return "N/A", "N/A"  # Return N/A when fraction is absent
+        return current_int, current_dec, old_int, old_dec  # Return both prices
 
-        integer_part = fraction.get_text(strip=True)  # Extract integer part of old price
-        cents = old_el.find("span", **HTML_SELECTORS["current_price_cents"])  # Find cents span within the old price element
-        decimal_part = cents.get_text(strip=True) if cents and isinstance(cents, Tag) else "00"  # Extract decimal part or default to 00
-
-        verbose_output(f"{BackgroundColors.GREEN}[DEBUG] Old price extracted: {BackgroundColors.CYAN}{integer_part}.{decimal_part}{Style.RESET_ALL}")  # Log extracted old price
-
-        return integer_part, decimal_part  # Return detected old price parts
 
-
-    def extract_discount_percentage(self, soup):
+    def extract_discount_percentage(self, soup, old_price=None, current_price=None):
         """
         Extracts the discount percentage from the parsed HTML soup.
         
         :param soup: BeautifulSoup object containing the parsed HTML
+        :param old_price: Optional (integer_part, decimal_part) old price already extracted, to avoid looking it up again
+        :param current_price: Optional (integer_part, decimal_part) current price already extracted, to avoid looking it up again
         :return: Discount percentage string or "N/A" if not found
         """
         
@@ -419,12 +553,16 @@ class MercadoLivre:
             verbose_output(f"{BackgroundColors.GREEN}[DEBUG] Discount element found in document: {BackgroundColors.CYAN}{discount_text}{Style.RESET_ALL}")  # Log found discount element
             return discount_text  # Return the discount text directly when present
 
-        old_int, old_dec = self.extract_old_price(soup)  # Get old price components using container-aware logic
+        if not old_price or not current_price:  # Verify if the prices were not extracted yet
+            curr_int, curr_dec, old_int, old_dec = self.extract_prices(soup)  # Extract both prices in a single document walk
+            old_price, current_price = (old_int, old_dec), (curr_int, curr_dec)  # Group the price parts as tuples
+
+        old_int, old_dec = old_price  # Get old price components
         if old_int in (None, "N/A"):  # Verify if there is no old price detected
             verbose_output(f"{BackgroundColors.YELLOW}[DEBUG] No old price present; discount will not be computed.{Style.RESET_ALL}")  # Log that discount is not applicable
             return "N/A"  # Return N/A when discount cannot be computed without an old price
 
-        curr_int, curr_dec = self.extract_current_price(soup)  # Get current price components for discount computation
+        curr_int, curr_dec = current_price  # Get current price components for discount computation
 
         try:  # Attempt to compute numeric discount percentage from price parts
             old_value = float(f"{old_int}.{old_dec}")  # Compose old price float value
@@ -506,7 +644,7 @@ class MercadoLivre:
                 html_text = response.text  # Get the HTML content from response
                 self.html_content = html_text  # Store for later use
             
-            soup = BeautifulSoup(html_text, "html.parser")  # Parse the HTML content (use str to satisfy type verifiers)
+            soup = self.get_soup(html_text)  # Parse the HTML content once and cache it for the media download
             
             self.product_data["name"] = self.extract_product_name(soup)  # Extract product name
 
@@ -515,15 +653,14 @@ class MercadoLivre:
             if is_international:  # If the product is international
                 self.prefix_international_name()  # Prefix the product name if it's international
             
-            current_price_int, current_price_dec = self.extract_current_price(soup)  # Extract current price
+            current_price_int, current_price_dec, old_price_int, old_price_dec = self.extract_prices(soup)  # Extract current and old prices in a single document walk
             self.product_data["current_price_integer"] = current_price_int  # Store integer part
             self.product_data["current_price_decimal"] = current_price_dec  # Store decimal part
             
-            old_price_int, old_price_dec = self.extract_old_price(soup)  # Extract old price
             self.product_data["old_price_integer"] = old_price_int  # Store integer part
             self.product_data["old_price_decimal"] = old_price_dec  # Store decimal part
             
-            self.product_data["discount_percentage"] = self.extract_discount_percentage(soup)  # Extract discount percentage
+            self.product_data["discount_percentage"] = self.extract_discount_percentage(soup, (old_price_int, old_price_dec), (current_price_int, current_price_dec))  # Extract discount percentage, reusing the prices extracted above
             self.product_data["description"] = self.extract_product_description(soup)  # Extract product description
             
             self.print_product_info(self.product_data) if VERBOSE else None  # Print the extracted product information if verbose
@@ -554,19 +691,9 @@ class MercadoLivre:
         if not text:  # If text is empty
             return text  # Return as is
         
-        text = re.sub(r"\*\*(.*?)\*\*", r"\1", text)  # Remove markdown bold formatting
-        
-        text = re.sub(r"\n{3,}", "\n\n", text)  # Replace 3 or more newlines with 2 newlines
-        
-        lines = text.split("\n")  # Split into lines
-        cleaned_lines = []  # List to store cleaned lines
-        for line in lines:  # Iterate through lines
-            cleaned_line = line.strip()  # Strip leading/trailing whitespace
-            if cleaned_line or (cleaned_lines and cleaned_lines[-1]):  # Keep single empty lines between paragraphs
-                cleaned_lines.append(cleaned_line)  # Add cleaned line
-        
-        text = "\n".join(cleaned_lines)  # Join cleaned lines
-        text = re.sub(r"\n{3,}", "\n\n", text)  # Ensure no more than 2 consecutive newlines
+        text = MARKDOWN_BOLD_PATTERN.sub(r"\1", text)  # Remove markdown bold formatting
+        text = LINE_EDGE_WHITESPACE_PATTERN.sub("\n", text)  # Strip leading/trailing whitespace of every line in a single pass
+        text = EXCESS_NEWLINES_PATTERN.sub("\n\n", text)  # Keep single empty lines between paragraphs by collapsing 3 or more newlines into 2
         
         return text.strip()  # Return cleaned text
 
@@ -582,18 +709,10 @@ class MercadoLivre:
         if not text:  # If text is empty
             return text  # Return as is
         
-        sentences = re.split(r"([.!?]\s*)", text)  # Keep the delimiters
-        
-        result = []  # List to store processed sentences
-        for i, sentence in enumerate(sentences):  # Iterate through sentences
-            if sentence.strip():  # If sentence is not empty
-                if i % 2 == 0:  # Even indices are the actual sentence content
-                    sentence = sentence.strip()  # Strip leading/trailing whitespace
-                    if sentence:  # If still not empty
-                        sentence = sentence[0].upper() + sentence[1:].lower()  # Capitalize first letter
-                result.append(sentence)  # Add to result
+        parts = SENTENCE_DELIMITER_PATTERN.split(text)  # Split into sentences at even indices and delimiters at odd indices
+        parts[::2] = [sentence[:1].upper() + sentence[1:].lower() for sentence in (part.strip() for part in parts[::2])]  # Strip and capitalize every sentence in one slice assignment
         
-        return "".join(result)  # Join and return
+        return "".join(parts)  # Join all sentences and delimiters back into a single string
 
 
     def is_valid_product_info(self, product_info):
@@ -664,25 +783,24 @@ class MercadoLivre:
         return output_dir  # Return the output directory path
 
 
-    def fetch_product_page(self, session, product_url):
+    def fetch_product_page(self, product_url):
         """
         Fetches the product page and returns the parsed BeautifulSoup object.
         Supports both HTTP fetching and local HTML file reading.
+        Always uses the instance session so the page request reuses the connection opened for the listing page.
         
-        :param session: Requests session object
         :param product_url: URL of the product page
         :return: BeautifulSoup object containing the parsed HTML
         """
         
-        if self.html_content:
-            soup = BeautifulSoup(self.html_content, "html.parser")
-            return soup
+        if self.html_content:  # If HTML content is already stored (from scrape_product_info or a local file)
+            return self.get_soup(self.html_content)  # Reuse the cached parse tree
         
-        response = session.get(product_url, timeout=10)  # Make a GET request to the product URL
+        response = self.session.get(product_url, timeout=10)  # Make a GET request to the product URL using the shared instance session
         response.raise_for_status()  # Raise exception for bad status
-        soup = BeautifulSoup(response.text, "html.parser")  # Parse the HTML content (use str to satisfy type verifiers)
+        self.html_content = response.text  # Store the HTML content for later use
         
-        return soup  # Return the parsed soup
+        return self.get_soup(self.html_content)  # Parse and cache the HTML content
 
     
     def safe_get_attr(self, tag, *attrs):
@@ -805,9 +923,10 @@ class MercadoLivre:
                     
                     if video_url:  # If video URL found
                         video_data.append((video_url, thumbnail_url))
-                        verbose_output(
-                            f"{BackgroundColors.GREEN}Found HLS video: {BackgroundColors.CYAN}{video_url}{BackgroundColors.GREEN} (duration: {video_duration}s){Style.RESET_ALL}"
-                        )
+                        if VERBOSE:  # Avoid building the message when verbose output is disabled
+                            verbose_output(
+                                f"{BackgroundColors.GREEN}Found HLS video: {BackgroundColors.CYAN}{video_url}{BackgroundColors.GREEN} (duration: {video_duration}s){Style.RESET_ALL}"
+                            )
             else:  # If JSON not found, fall back to HTML parsing
                 verbose_output(
                     f"{BackgroundColors.YELLOW}__PRELOADED_STATE__ not found, verifying HTML...{Style.RESET_ALL}"
@@ -826,9 +945,10 @@ class MercadoLivre:
                         thumbnail_img = clip_wrapper.find("img", class_="clip-wrapper__thumbnail")
                         if thumbnail_img and isinstance(thumbnail_img, Tag):
                             thumbnail_url = self.safe_get_attr(thumbnail_img, "src")  # Safely extract thumbnail src
-                            verbose_output(
-                                f"{BackgroundColors.YELLOW}Found video thumbnail in HTML (video URL requires JSON): {thumbnail_url}{Style.RESET_ALL}"
-                            )
+                            if VERBOSE:  # Avoid building the message when verbose output is disabled
+                                verbose_output(
+                                    f"{BackgroundColors.YELLOW}Found video thumbnail in HTML (video URL requires JSON): {thumbnail_url}{Style.RESET_ALL}"
+                                )
         
         except json.JSONDecodeError as e:
             print(f"{BackgroundColors.RED}Error parsing JSON: {e}{Style.RESET_ALL}")
@@ -1001,9 +1121,6 @@ class MercadoLivre:
                     )
                     return None  # Return None if ffmpeg timed out
             else:  # Regular HTTP video URL
-                video_response = session.get(video_url, timeout=30)  # Download video (longer timeout)
-                video_response.raise_for_status()  # Raise exception on bad status
-                
                 parsed_url = urlparse(video_url)  # Parse URL
                 ext = os.path.splitext(parsed_url.path)[1]  # Get file extension
                 if not ext or ext not in [".mp4", ".webm", ".mov", ".avi"]:  # If no extension or not a common video format
@@ -1012,8 +1129,18 @@ class MercadoLivre:
                 filename = f"video_{video_count:03d}{ext}"  # Create filename
                 video_path = os.path.join(output_dir, filename)  # Create path
                 
-                with open(video_path, "wb") as f:  # Write file
-                    f.write(video_response.content)  # Write content
+                partial_path = video_path + ".part"  # Temporary path so an interrupted stream never leaves a truncated video behind
+                
+                try:  # Stream into the temporary file and move it into place only once complete
+                    with session.get(video_url, timeout=30, stream=True) as video_response:  # Stream video (longer timeout) instead of buffering it in memory
+                        video_response.raise_for_status()  # Raise exception on bad status
+                        with open(partial_path, "wb") as f:  # Write file
+                            for chunk in video_response.iter_content(chunk_size=VIDEO_DOWNLOAD_CHUNK_SIZE):  # Iterate streamed response chunks in large blocks
+                                f.write(chunk)  # Write chunk to disk as it arrives
+                    os.replace(partial_path, video_path)  # Atomically rename the completed download to its final name
+                finally:  # Clean up after a failed or interrupted stream
+                    if os.path.exists(partial_path):  # If the temporary file is still present, the download did not complete
+                        os.remove(partial_path)  # Remove the partial download
                 
                 verbose_output(
                     f"{BackgroundColors.GREEN}Downloaded video: {BackgroundColors.CYAN}{filename}{Style.RESET_ALL}"
@@ -1042,16 +1169,14 @@ class MercadoLivre:
         downloaded_images = []  # List to store downloaded image file paths
         
         if soup is None:  # If soup not provided, fetch and parse the product page
-            soup = self.fetch_product_page(session, product_url)  # Fetch and parse the product page
+            soup = self.fetch_product_page(product_url)  # Fetch and parse the product page
         
         image_urls = self.find_image_urls(soup)  # Find all image URLs
         
-        image_count = 0  # Counter for images
-        for img_url in image_urls:  # Iterate through image URLs
-            image_count += 1  # Increment counter
-            filepath = self.download_single_image(session, img_url, output_dir, image_count)  # Download image
-            if filepath:  # If download successful
-                downloaded_images.append(filepath)  # Add to list
+        if image_urls:  # Verify if there are images to download
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_IMAGE_DOWNLOADS, len(image_urls))) as executor:  # Create bounded worker pool to overlap image requests
+                image_paths = executor.map(self.download_single_image, [session] * len(image_urls), image_urls, [output_dir] * len(image_urls), range(1, len(image_urls) + 1))  # Download images concurrently keeping gallery order and 1-based counters
+                downloaded_images = [filepath for filepath in image_paths if filepath]  # Keep only successful downloads
         
         return downloaded_images  # Return list of downloaded image files
 
@@ -1070,7 +1195,7 @@ class MercadoLivre:
         downloaded_videos = []  # List to store downloaded video file paths
         
         if soup is None:  # If soup not provided, fetch and parse the product page
-            soup = self.fetch_product_page(session, product_url)  # Fetch and parse the product page
+            soup = self.fetch_product_page(product_url)  # Fetch and parse the product page
         
         video_data = self.find_video_urls(soup)  # Find all video URLs
         
@@ -1162,7 +1287,7 @@ class MercadoLivre:
             return asset_map  # Nothing to collect
 
         try:  # Attempt to build at least a basic asset mapping
-            soup = BeautifulSoup(html_content, "html.parser")  # Parse HTML to locate asset tags
+            soup = BeautifulSoup(html_content, HTML_PARSER)  # Parse HTML to locate asset tags
             for img in soup.find_all("img"):  # Iterate over all img tags
                 src = self.safe_get_attr(img, "src", "data-src")  # Safely prefer src then data-src
                 if not src:  # Skip when no source found
@@ -1235,20 +1360,20 @@ class MercadoLivre:
             output_dir = self.create_output_directory(product_name_safe)  # Create output directory using normalized product name
             self.product_data["product_name_safe"] = os.path.basename(output_dir)  # Store canonical directory name for main.py lookup
             
-            soup = self.fetch_product_page(self.session, self.product_url)  # Fetch and parse the product page
+            soup = self.fetch_product_page(self.product_url)  # Fetch and parse the product page
             
             verbose_output(
                 f"{BackgroundColors.GREEN}Downloading images from gallery...{Style.RESET_ALL}"
             )  # Output the step message
             
-            downloaded_images = self.download_product_images(self.session, self.product_url, output_dir, soup)  # Download images
+            downloaded_images = self.download_product_images(self.media_session, self.product_url, output_dir, soup)  # Download images through the fast-failing media session
             downloaded_files.extend(downloaded_images)  # Add images to downloaded files
             
             verbose_output(
                 f"{BackgroundColors.GREEN}Downloading videos from gallery...{Style.RESET_ALL}"
             )  # Output the step message
             
-            downloaded_videos = self.download_product_videos(self.session, self.product_url, output_dir, soup)  # Download videos
+            downloaded_videos = self.download_product_videos(self.media_session, self.product_url, output_dir, soup)  # Download videos through the fast-failing media session
             downloaded_files.extend(downloaded_videos)  # Add videos to downloaded files
             
             verbose_output(
@@ -1319,6 +1444,35 @@ class MercadoLivre:
         return self.product_data  # Return the complete product data
 
 
+    @classmethod
+    def scrape_many(cls, urls, prefix="", output_directory=OUTPUT_DIRECTORY, max_workers=MAX_CONCURRENT_SCRAPES):
+        """
+        Scrapes multiple product URLs concurrently on a bounded thread pool.
+        Each URL gets its own scraper instance and session, so a failed product does not affect the others.
+
+        :param urls: List of Mercado Livre product URLs to scrape
+        :param prefix: Optional platform prefix for output directory naming (e.g., "MercadoLivre")
+        :param output_directory: Output directory path for storing scraped data
+        :param max_workers: Maximum number of products scraped concurrently
+        :return: List of product data dictionaries (or None for failures) in the same order as urls
+        """
+
+        results = [None] * len(urls)  # Initialize results list preserving input order
+        if not urls:  # If there are no URLs to scrape
+            return results  # Return empty results list
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:  # Create bounded worker pool for the network-bound scrapes
+            futures = {executor.submit(cls(url, prefix=prefix, output_directory=output_directory).scrape): index for index, url in enumerate(urls)}  # Map each submitted scrape to its URL index
+
+            for future in concurrent.futures.as_completed(futures):  # Collect results as workers complete
+                try:  # Try to retrieve the worker result
+                    results[futures[future]] = future.result()  # Store product data at the URL index
+                except Exception as e:  # If the worker raised an error
+                    print(f"{BackgroundColors.RED}Error during scraping of {urls[futures[future]]}: {e}{Style.RESET_ALL}")  # Output the error message
+
+        return results  # Return product data list in input order
+
+
 # Functions Definitions:
 
 
@@ -1359,10 +1513,8 @@ def verify_dot_env_file():
     :return: True if the .env file exists, False otherwise
     """
 
-    env_path = Path(__file__).parent / ".env"  # Path to the .env file
-    
-    if not verify_filepath_exists(env_path):  # If the .env file does not exist
-        print(f"{BackgroundColors.CYAN}.env{BackgroundColors.YELLOW} file not found at {BackgroundColors.CYAN}{env_path}{BackgroundColors.YELLOW}.{Style.RESET_ALL}")
+    if not verify_filepath_exists(ENV_FILE_PATH):  # If the .env file does not exist
+        print(f"{BackgroundColors.CYAN}.env{BackgroundColors.YELLOW} file not found at {BackgroundColors.CYAN}{ENV_FILE_PATH}{BackgroundColors.YELLOW}.{Style.RESET_ALL}")
         return False  # Return False
 
     return True  # Return True if the .env file exists
@@ -1454,13 +1606,11 @@ def calculate_execution_time(start_time, finish_time=None):
 
     if total_seconds is None:  # Ensure a numeric value
         total_seconds = 0.0  # Default to zero
-    if total_seconds < 0:  # Normalize negative durations
-        total_seconds = abs(total_seconds)  # Use absolute value
+    total_seconds = abs(total_seconds)  # Normalize negative durations (abs leaves non-negative values unchanged)
 
-    days = int(total_seconds // 86400)  # Compute full days
-    hours = int((total_seconds % 86400) // 3600)  # Compute remaining hours
-    minutes = int((total_seconds % 3600) // 60)  # Compute remaining minutes
-    seconds = int(total_seconds % 60)  # Compute remaining seconds
+    minutes, seconds = divmod(int(total_seconds), 60)  # Split whole seconds into minutes and remaining seconds
+    hours, minutes = divmod(minutes, 60)  # Split minutes into hours and remaining minutes
+    days, hours = divmod(hours, 24)  # Split hours into full days and remaining hours
 
     if days > 0:  # Include days when present
         return f"{days}d {hours}h {minutes}m {seconds}s"  # Return formatted days+hours+minutes+seconds
@@ -1479,13 +1629,18 @@ def play_sound():
     :return: None
     """
 
-    current_os = platform.system()  # Get the current operating system
+    current_os = CURRENT_OS  # Get the current operating system resolved at import
     if current_os == "Windows":  # If the current operating system is Windows
         return  # Do nothing
 
     if verify_filepath_exists(SOUND_FILE):  # If the sound file exists
         if current_os in SOUND_COMMANDS:  # If the platform.system() is in the SOUND_COMMANDS dictionary
-            os.system(f"{SOUND_COMMANDS[current_os]} {SOUND_FILE}")  # Play the sound
+            try:  # Try to run the sound player
+                subprocess.run([SOUND_COMMANDS[current_os], SOUND_FILE], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)  # Play the sound directly, without spawning an intermediate shell
+            except OSError as e:  # If the player binary is missing or cannot be executed
+                print(
+                    f"{BackgroundColors.RED}Could not run {BackgroundColors.CYAN}{SOUND_COMMANDS[current_os]}{BackgroundColors.RED} to play the sound: {e}{Style.RESET_ALL}"
+                )
         else:  # If the platform.system() is not in the SOUND_COMMANDS dictionary
             print(
                 f"{BackgroundColors.RED}The {BackgroundColors.CYAN}{current_os}{BackgroundColors.RED} is not in the {BackgroundColors.CYAN}SOUND_COMMANDS dictionary{BackgroundColors.RED}. Please add it!{Style.RESET_ALL}"
@@ -1508,7 +1663,8 @@ def main():
         f"{BackgroundColors.BOLD}{BackgroundColors.GREEN}Welcome to the {BackgroundColors.CYAN}Mercado Livre Scraper{BackgroundColors.GREEN} program!{Style.RESET_ALL}",
         end="\n",
     )  # Output the welcome message
-    start_time = datetime.datetime.now()  # Get the start time of the program
+    start_time = datetime.datetime.now()  # Get the start time of the program for display
+    start_monotonic = time.monotonic()  # Record monotonic start time for measuring the elapsed duration
 
     test_url = "https://mercadolivre.com/sec/2XY9zrA"  # Test URL
     
@@ -1525,17 +1681,14 @@ def main():
             f"\n{BackgroundColors.RED}Error during scraping: {e}{Style.RESET_ALL}\n"
         )  # Output the error message
 
-    finish_time = datetime.datetime.now()  # Get the finish time of the program
+    finish_time = datetime.datetime.now()  # Get the finish time of the program for display
+    elapsed_seconds = time.monotonic() - start_monotonic  # Measure elapsed duration, unaffected by wall clock adjustments
     print(
-        f"{BackgroundColors.GREEN}Start time: {BackgroundColors.CYAN}{start_time.strftime('%d/%m/%Y - %H:%M:%S')}\n{BackgroundColors.GREEN}Finish time: {BackgroundColors.CYAN}{finish_time.strftime('%d/%m/%Y - %H:%M:%S')}\n{BackgroundColors.GREEN}Execution time: {BackgroundColors.CYAN}{calculate_execution_time(start_time, finish_time)}{Style.RESET_ALL}"
+        f"{BackgroundColors.GREEN}Start time: {BackgroundColors.CYAN}{start_time.strftime(TIMESTAMP_FORMAT)}\n{BackgroundColors.GREEN}Finish time: {BackgroundColors.CYAN}{finish_time.strftime(TIMESTAMP_FORMAT)}\n{BackgroundColors.GREEN}Execution time: {BackgroundColors.CYAN}{calculate_execution_time(elapsed_seconds)}{Style.RESET_ALL}"
     )  # Output the start and finish times
     print(
         f"{BackgroundColors.BOLD}{BackgroundColors.GREEN}Program finished.{Style.RESET_ALL}"
     )  # Output the end of the program message
-    
-    (
-        atexit.register(play_sound) if RUN_FUNCTIONS["Play Sound"] else None
-    )  # Register the play_sound function to be called when the program finishes
 
 
 if __name__ == "__main__":
@@ -1545,4 +1698,11 @@ if __name__ == "__main__":
     :return: None
     """
 
+    logger = Logger(f"./Logs/{Path(__file__).stem}.log", clean=True)  # Create a Logger instance only when run as a script, so importing this module opens no log file
+    sys.stdout = logger  # Redirect stdout to the logger
+    sys.stderr = logger  # Redirect stderr to the logger
+
+    if RUN_FUNCTIONS.get("Play Sound"):  # Register before main() runs so the sound also plays on interrupted or failed runs
+        atexit.register(play_sound)  # Register play_sound to run at exit
+
     main()  # Call the main function
\ No newline at end of file